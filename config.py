@@ -10,6 +10,86 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or f"sqlite:///{BASE_DIR}/bolaquent.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Connection pool per worker process for server databases (PostgreSQL, MySQL); SQLite
+    # keeps SQLAlchemy's defaults. Live usage is reported at /admin/pool-stats.
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))  # seconds to wait for a connection
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))  # seconds before reconnecting
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    SQLALCHEMY_ENGINE_OPTIONS = {}  # extra create_engine() arguments; override the above
+
+    # Optional read replica for @read_only views (see utils/routing.py). A user who just
+    # wrote keeps reading from the primary for REPLICA_STICKY_SECONDS.
+    SQLALCHEMY_REPLICA_URI = os.environ.get("DATABASE_REPLICA_URL")
+    REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", 10))
+
+    # SQLite pragmas set on every new connection (other databases ignore them). WAL lets
+    # readers proceed while an answer is being committed; busy_timeout makes writers wait
+    # for the lock instead of failing with "database is locked".
+    SQLITE_PRAGMAS = {
+        "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+        "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", -20000)),  # negative = KiB
+        "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 128 * 1024 * 1024)),
+        "temp_store": "MEMORY",
+    }
+
+    # Caching: in-process by default, shared across workers when Redis is configured
+    CACHE_DEFAULT_TTL = int(os.environ.get("CACHE_DEFAULT_TTL", 300))
+    CACHE_REDIS_URL = os.environ.get("REDIS_URL")
+    ADMIN_STATS_TTL = int(os.environ.get("ADMIN_STATS_TTL", 30))
+    PAGE_CACHE_SIZE = int(os.environ.get("PAGE_CACHE_SIZE", 64))  # rendered guest pages per worker
+
+    # Registered users allowed to list and export user accounts (comma-separated usernames)
+    ADMIN_USERNAMES = {
+        name.strip() for name in os.environ.get("ADMIN_USERNAMES", "").split(",") if name.strip()
+    }
+
+    # Admin listings are keyset-paginated
+    ADMIN_PAGE_SIZE = 50
+    ADMIN_MAX_PAGE_SIZE = 200
+    EXPORT_BATCH_SIZE = 500  # rows fetched per round trip when streaming exports
+
+    # Background jobs (vocabulary expansion) run on this many threads per process
+    JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 2))
+    # Active jobs whose progress heartbeat is older than this are treated as failed
+    JOB_HEARTBEAT_TIMEOUT = int(os.environ.get("JOB_HEARTBEAT_TIMEOUT", 600))  # seconds
+
+    # Static files are served from an in-memory manifest with content-hash ETags
+    STATIC_MAX_AGE = int(os.environ.get("STATIC_MAX_AGE", 31536000))  # seconds (1 year)
+
+    # Response compression (utils/compression.py); turn off when a proxy already compresses
+    COMPRESS_RESPONSES = os.environ.get("COMPRESS_RESPONSES", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", 500))  # bytes
+    COMPRESS_LEVEL = int(os.environ.get("COMPRESS_LEVEL", 6))
+    COMPRESS_MIMETYPES = [
+        "text/html",
+        "text/css",
+        "text/plain",
+        "text/csv",
+        "text/javascript",
+        "application/javascript",
+        "application/json",
+        "application/x-ndjson",
+        "image/svg+xml",
+    ]
+
+    # Compiled Jinja templates are cached on disk and shared by workers (utils/templates.py);
+    # TEMPLATE_PRECOMPILE compiles them all in create_app instead of on first render
+    TEMPLATE_BYTECODE_CACHE = True
+    TEMPLATE_CACHE_DIR = os.environ.get("TEMPLATE_CACHE_DIR")  # default: system temp dir
+    TEMPLATE_PRECOMPILE = os.environ.get("TEMPLATE_PRECOMPILE", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
     # Upload folders
     UPLOAD_FOLDER = os.path.join(BASE_DIR, "uploads")
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
@@ -29,6 +109,9 @@ class Config:
         6: 25,  # Adult
     }
 
+    # Largest answer batch accepted by /learning/practice/submit-batch
+    MAX_ANSWERS_PER_BATCH = 100
+
     SESSION_TIMEOUT_MINUTES = {
         1: 5,  # Early Verbal
         2: 10,  # Preschool
@@ -1,4042 +1,22 @@
 # Comprehensive 600-word vocabulary list for Bolaquent
 # Each tier expanded from 10 to 100 words following pedagogical principles
+#
+# The words themselves live in data/expanded_vocabulary.jsonl and are inserted
+# by utils.seeding.seed_vocabulary() (flask --app app seed-vocabulary). The
+# expanded_vocabulary list of VocabularyWord objects is still available, but is
+# only built when first accessed.
 
-from models import VocabularyWord
+from utils.seeding import EXPANDED_VOCABULARY, iter_seed_file
 
-expanded_vocabulary = [
-    # ==================== TIER 1: EARLY VERBAL (Ages 2-3) - 100 words ====================
-    # Basic concrete words, 2-4 word definitions
-    # EXISTING 10 WORDS (keeping original)
-    VocabularyWord(
-        word="cat", definition="Pet with fur", tier_id=1, category="animals", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="red",
-        definition="Color like apple",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="big",
-        definition="Very large",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="milk", definition="White drink", tier_id=1, category="food", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="go", definition="Move away", tier_id=1, category="actions", part_of_speech="verb"
-    ),
-    VocabularyWord(
-        word="hot",
-        definition="Very warm",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="ball", definition="Round toy", tier_id=1, category="toys", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="more",
-        definition="Want extra",
-        tier_id=1,
-        category="requests",
-        part_of_speech="adverb",
-    ),
-    VocabularyWord(
-        word="up", definition="Go higher", tier_id=1, category="directions", part_of_speech="adverb"
-    ),
-    VocabularyWord(
-        word="bye",
-        definition="See you later",
-        tier_id=1,
-        category="social",
-        part_of_speech="interjection",
-    ),
-    # 90 NEW WORDS
-    # Animals (15 words)
-    VocabularyWord(
-        word="dog",
-        definition="Pet that barks",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="fish",
-        definition="Lives in water",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="bird", definition="Flies in sky", tier_id=1, category="animals", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="cow",
-        definition="Big farm animal",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="pig",
-        definition="Pink farm animal",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="duck",
-        definition="Yellow water bird",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="bee", definition="Makes honey", tier_id=1, category="animals", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="frog",
-        definition="Green jumpy animal",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="bear",
-        definition="Big furry animal",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="horse",
-        definition="Runs very fast",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="sheep",
-        definition="White fluffy animal",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="rabbit",
-        definition="Hops and jumps",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="mouse",
-        definition="Very small animal",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="lion",
-        definition="Big cat roars",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="turtle",
-        definition="Has hard shell",
-        tier_id=1,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    # Colors (8 words)
-    VocabularyWord(
-        word="blue",
-        definition="Color of sky",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="green",
-        definition="Color of grass",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="yellow",
-        definition="Color of sun",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="black",
-        definition="Dark color",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="white",
-        definition="Light color",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="pink",
-        definition="Light red color",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="orange",
-        definition="Color of carrot",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="brown",
-        definition="Color of dirt",
-        tier_id=1,
-        category="colors",
-        part_of_speech="adjective",
-    ),
-    # Body Parts (10 words)
-    VocabularyWord(
-        word="head", definition="Top of body", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="eyes", definition="Used to see", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="nose", definition="Used to smell", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="mouth", definition="Used to eat", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="hands", definition="Used to touch", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="feet", definition="Used to walk", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="ears", definition="Used to hear", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="hair", definition="Grows on head", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="teeth", definition="Used to bite", tier_id=1, category="body", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="tummy",
-        definition="Where food goes",
-        tier_id=1,
-        category="body",
-        part_of_speech="noun",
-    ),
-    # Food (12 words)
-    VocabularyWord(
-        word="apple",
-        definition="Red round fruit",
-        tier_id=1,
-        category="food",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="banana",
-        definition="Yellow long fruit",
-        tier_id=1,
-        category="food",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cookie",
-        definition="Sweet round treat",
-        tier_id=1,
-        category="food",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="bread", definition="Food made soft", tier_id=1, category="food", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="water", definition="Clear drink", tier_id=1, category="food", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="juice",
-        definition="Sweet fruit drink",
-        tier_id=1,
-        category="food",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cheese", definition="Yellow food", tier_id=1, category="food", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="egg", definition="White oval food", tier_id=1, category="food", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="soup", definition="Hot liquid food", tier_id=1, category="food", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="rice",
-        definition="Small white food",
-        tier_id=1,
-        category="food",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cake",
-        definition="Sweet birthday food",
-        tier_id=1,
-        category="food",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="pizza",
-        definition="Round cheesy food",
-        tier_id=1,
-        category="food",
-        part_of_speech="noun",
-    ),
-    # Actions (12 words)
-    VocabularyWord(
-        word="eat", definition="Put in mouth", tier_id=1, category="actions", part_of_speech="verb"
-    ),
-    VocabularyWord(
-        word="drink",
-        definition="Swallow liquid",
-        tier_id=1,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="run",
-        definition="Move very fast",
-        tier_id=1,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="jump", definition="Go up high", tier_id=1, category="actions", part_of_speech="verb"
-    ),
-    VocabularyWord(
-        word="sit", definition="Rest on chair", tier_id=1, category="actions", part_of_speech="verb"
-    ),
-    VocabularyWord(
-        word="sleep",
-        definition="Close eyes rest",
-        tier_id=1,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="play", definition="Have fun", tier_id=1, category="actions", part_of_speech="verb"
-    ),
-    VocabularyWord(
-        word="walk",
-        definition="Move with feet",
-        tier_id=1,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="look",
-        definition="Use your eyes",
-        tier_id=1,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="come", definition="Move here", tier_id=1, category="actions", part_of_speech="verb"
-    ),
-    VocabularyWord(
-        word="stop", definition="Do not move", tier_id=1, category="actions", part_of_speech="verb"
-    ),
-    VocabularyWord(
-        word="help",
-        definition="Make it easier",
-        tier_id=1,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    # Toys & Objects (10 words)
-    VocabularyWord(
-        word="car", definition="Toy that rolls", tier_id=1, category="toys", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="book", definition="Has many pages", tier_id=1, category="toys", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="doll", definition="Looks like baby", tier_id=1, category="toys", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="block",
-        definition="Square toy piece",
-        tier_id=1,
-        category="toys",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cup", definition="Holds water", tier_id=1, category="objects", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="spoon", definition="Used to eat", tier_id=1, category="objects", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="bed", definition="Sleep on it", tier_id=1, category="objects", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="chair", definition="Sit on it", tier_id=1, category="objects", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="door",
-        definition="Opens and closes",
-        tier_id=1,
-        category="objects",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="shoe", definition="Wear on feet", tier_id=1, category="objects", part_of_speech="noun"
-    ),
-    # Descriptors (8 words)
-    VocabularyWord(
-        word="small",
-        definition="Not big",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="cold",
-        definition="Not hot",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="soft",
-        definition="Not hard",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="loud",
-        definition="Makes noise",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="fast",
-        definition="Very quick",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="slow",
-        definition="Not fast",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="wet",
-        definition="Has water",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="dry",
-        definition="No water",
-        tier_id=1,
-        category="descriptors",
-        part_of_speech="adjective",
-    ),
-    # Family & People (6 words)
-    VocabularyWord(
-        word="mama", definition="Mother person", tier_id=1, category="family", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="dada", definition="Father person", tier_id=1, category="family", part_of_speech="noun"
-    ),
-    VocabularyWord(
-        word="baby",
-        definition="Very little person",
-        tier_id=1,
-        category="family",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="me", definition="Myself", tier_id=1, category="pronouns", part_of_speech="pronoun"
-    ),
-    VocabularyWord(
-        word="you",
-        definition="Other person",
-        tier_id=1,
-        category="pronouns",
-        part_of_speech="pronoun",
-    ),
-    VocabularyWord(
-        word="mine",
-        definition="Belongs to me",
-        tier_id=1,
-        category="pronouns",
-        part_of_speech="pronoun",
-    ),
-    # Numbers & Basic Concepts (5 words)
-    VocabularyWord(
-        word="one",
-        definition="Single thing",
-        tier_id=1,
-        category="numbers",
-        part_of_speech="number",
-    ),
-    VocabularyWord(
-        word="two",
-        definition="Pair of things",
-        tier_id=1,
-        category="numbers",
-        part_of_speech="number",
-    ),
-    VocabularyWord(
-        word="all",
-        definition="Every one",
-        tier_id=1,
-        category="concepts",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="no", definition="Not yes", tier_id=1, category="concepts", part_of_speech="adverb"
-    ),
-    VocabularyWord(
-        word="yes", definition="I agree", tier_id=1, category="concepts", part_of_speech="adverb"
-    ),
-    # Directions & Locations (4 words)
-    VocabularyWord(
-        word="down",
-        definition="Go lower",
-        tier_id=1,
-        category="directions",
-        part_of_speech="adverb",
-    ),
-    VocabularyWord(
-        word="in",
-        definition="Inside of",
-        tier_id=1,
-        category="directions",
-        part_of_speech="preposition",
-    ),
-    VocabularyWord(
-        word="out",
-        definition="Outside of",
-        tier_id=1,
-        category="directions",
-        part_of_speech="adverb",
-    ),
-    VocabularyWord(
-        word="here",
-        definition="This place",
-        tier_id=1,
-        category="directions",
-        part_of_speech="adverb",
-    ),
-    # ==================== TIER 2: PRESCHOOL (Ages 4-5) - 100 words ====================
-    # Expanded vocabulary, 4-6 word definitions
-    # EXISTING 10 WORDS (keeping original)
-    VocabularyWord(
-        word="happy",
-        definition="Feeling good and smiling",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="friend",
-        definition="Someone you like to play with",
-        tier_id=2,
-        category="social",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="scared",
-        definition="Feeling afraid of something",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="share",
-        definition="Let others use your things",
-        tier_id=2,
-        category="social",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="count",
-        definition="Say numbers in order",
-        tier_id=2,
-        category="math",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="circle",
-        definition="Round shape like a ball",
-        tier_id=2,
-        category="shapes",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="family",
-        definition="People who live together and care",
-        tier_id=2,
-        category="social",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="rainbow",
-        definition="Pretty colors in the sky",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="gentle",
-        definition="Being soft and kind",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="listen",
-        definition="Use your ears to hear",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    # 90 NEW WORDS
-    # Emotions & Feelings (15 words)
-    VocabularyWord(
-        word="sad",
-        definition="Feeling unhappy and crying",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="angry",
-        definition="Feeling mad about something",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="excited",
-        definition="Feeling very happy about something",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="proud",
-        definition="Feeling good about what you did",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="sorry",
-        definition="Feeling bad about your mistake",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="brave",
-        definition="Not afraid to try something",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="worried",
-        definition="Thinking something bad might happen",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="silly",
-        definition="Being funny and making jokes",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="surprised",
-        definition="Feeling shocked about something unexpected",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="calm",
-        definition="Feeling peaceful and not upset",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="jealous",
-        definition="Wanting what someone else has",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="confused",
-        definition="Not understanding what is happening",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="lonely",
-        definition="Feeling sad because no friends around",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="grateful",
-        definition="Feeling thankful for good things",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="curious",
-        definition="Wanting to learn about new things",
-        tier_id=2,
-        category="emotions",
-        part_of_speech="adjective",
-    ),
-    # Shapes & Math (12 words)
-    VocabularyWord(
-        word="square",
-        definition="Shape with four equal sides",
-        tier_id=2,
-        category="shapes",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="triangle",
-        definition="Shape with three pointy corners",
-        tier_id=2,
-        category="shapes",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="rectangle",
-        definition="Shape like a long square",
-        tier_id=2,
-        category="shapes",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="star",
-        definition="Shape with five pointy parts",
-        tier_id=2,
-        category="shapes",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="heart",
-        definition="Shape that means love",
-        tier_id=2,
-        category="shapes",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="diamond",
-        definition="Square shape turned sideways",
-        tier_id=2,
-        category="shapes",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="add",
-        definition="Put numbers together to get more",
-        tier_id=2,
-        category="math",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="subtract",
-        definition="Take away numbers to get less",
-        tier_id=2,
-        category="math",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="equal",
-        definition="Both sides have the same amount",
-        tier_id=2,
-        category="math",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="pattern",
-        definition="Things that repeat the same way",
-        tier_id=2,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="measure",
-        definition="Find out how big something is",
-        tier_id=2,
-        category="math",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="sort",
-        definition="Put things into different groups",
-        tier_id=2,
-        category="math",
-        part_of_speech="verb",
-    ),
-    # Nature & Weather (12 words)
-    VocabularyWord(
-        word="sun",
-        definition="Bright yellow light in the sky",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="moon",
-        definition="Round light in the night sky",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="stars",
-        definition="Tiny lights that sparkle at night",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cloud",
-        definition="White fluffy things in the sky",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="rain",
-        definition="Water drops that fall from clouds",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="snow",
-        definition="White cold flakes from the sky",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="wind",
-        definition="Air that moves and blows things",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="tree",
-        definition="Tall plant with leaves and branches",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="flower",
-        definition="Pretty colorful part of plants",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="ocean",
-        definition="Very big water where fish live",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="mountain",
-        definition="Very tall hill that touches clouds",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="river",
-        definition="Long water that flows to ocean",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    # Social & Behavior (15 words)
-    VocabularyWord(
-        word="kind",
-        definition="Being nice and helpful to others",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="polite",
-        definition="Using good manners and saying please",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="honest",
-        definition="Always telling the truth",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="patient",
-        definition="Waiting calmly without getting upset",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="helpful",
-        definition="Doing nice things for other people",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="responsible",
-        definition="Taking care of your important jobs",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="respect",
-        definition="Treating others the way they deserve",
-        tier_id=2,
-        category="behavior",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cooperate",
-        definition="Working together with other people",
-        tier_id=2,
-        category="social",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="include",
-        definition="Let everyone join in the fun",
-        tier_id=2,
-        category="social",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="apologize",
-        definition="Say sorry when you make mistakes",
-        tier_id=2,
-        category="social",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="celebrate",
-        definition="Have a party for something special",
-        tier_id=2,
-        category="social",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="tradition",
-        definition="Special things families do every year",
-        tier_id=2,
-        category="social",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="community",
-        definition="All the people living near you",
-        tier_id=2,
-        category="social",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="neighbor",
-        definition="Person who lives close to you",
-        tier_id=2,
-        category="social",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="introduce",
-        definition="Tell someone your name when meeting",
-        tier_id=2,
-        category="social",
-        part_of_speech="verb",
-    ),
-    # Actions & Abilities (10 words)
-    VocabularyWord(
-        word="climb",
-        definition="Go up high using hands and feet",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="dance",
-        definition="Move your body to music",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="sing",
-        definition="Make music with your voice",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="draw",
-        definition="Make pictures with crayons or pencils",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="build",
-        definition="Put pieces together to make something",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="create",
-        definition="Make something new and special",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="discover",
-        definition="Find something you never saw before",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="explore",
-        definition="Look around to find new things",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="imagine",
-        definition="Think of fun things in your mind",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="practice",
-        definition="Do something many times to get better",
-        tier_id=2,
-        category="actions",
-        part_of_speech="verb",
-    ),
-    # Time & Routine (8 words)
-    VocabularyWord(
-        word="morning",
-        definition="Time when the sun comes up",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="afternoon",
-        definition="Time after lunch before dinner",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="evening",
-        definition="Time when the sun goes down",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="night",
-        definition="Dark time when we go sleep",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="yesterday",
-        definition="The day that happened before today",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="today",
-        definition="This day that is happening right now",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="tomorrow",
-        definition="The day that comes after today",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="weekend",
-        definition="Saturday and Sunday when no school",
-        tier_id=2,
-        category="time",
-        part_of_speech="noun",
-    ),
-    # Animals & Habitats (8 words)
-    VocabularyWord(
-        word="elephant",
-        definition="Very big animal with long nose",
-        tier_id=2,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="giraffe",
-        definition="Tall animal with very long neck",
-        tier_id=2,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="monkey",
-        definition="Animal that swings from tree branches",
-        tier_id=2,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="penguin",
-        definition="Black and white bird that cannot fly",
-        tier_id=2,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="butterfly",
-        definition="Pretty insect with colorful wings",
-        tier_id=2,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="whale",
-        definition="Biggest animal that lives in ocean",
-        tier_id=2,
-        category="animals",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="forest",
-        definition="Place with many trees where animals live",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="jungle",
-        definition="Hot place with thick trees and vines",
-        tier_id=2,
-        category="nature",
-        part_of_speech="noun",
-    ),
-    # ==================== TIER 3: ELEMENTARY (Ages 6-10) - 100 words ====================
-    # Academic foundation, age-appropriate explanations
-    # EXISTING 10 WORDS (keeping original)
-    VocabularyWord(
-        word="community",
-        definition="A group of people living in the same area who help each other",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="habitat",
-        definition="The natural home where an animal lives and finds food",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="addition",
-        definition="Putting numbers together to find the total amount",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="character",
-        definition="A person or animal in a story or book",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="season",
-        definition="One of the four parts of the year like spring or winter",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="continent",
-        definition="A very large area of land like North America or Africa",
-        tier_id=3,
-        category="geography",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="compare",
-        definition="Look at two things to see how they are the same or different",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="mammal",
-        definition="An animal that feeds milk to its babies and has warm blood",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="pattern",
-        definition="Something that repeats in the same way over and over",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="opinion",
-        definition="What you think about something, not a fact",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    # 90 NEW WORDS
-    # Science & Nature (20 words)
-    VocabularyWord(
-        word="ecosystem",
-        definition="All the living and non-living things in an area that work together",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="photosynthesis",
-        definition="How plants use sunlight to make their own food",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="adaptation",
-        definition="Special features that help animals survive in their environment",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="carnivore",
-        definition="An animal that only eats meat from other animals",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="herbivore",
-        definition="An animal that only eats plants and vegetables",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="omnivore",
-        definition="An animal that eats both plants and meat",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="migration",
-        definition="When animals travel long distances to find food or warmer weather",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="camouflage",
-        definition="When animals hide by blending in with their surroundings",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="predator",
-        definition="An animal that hunts and eats other animals",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="prey",
-        definition="An animal that gets hunted and eaten by other animals",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="extinct",
-        definition="When a type of animal has died out and no longer exists",
-        tier_id=3,
-        category="science",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="fossil",
-        definition="Remains of plants or animals that lived millions of years ago",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="gravity",
-        definition="The force that pulls objects down toward the ground",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="solar system",
-        definition="The sun and all the planets that orbit around it",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="atmosphere",
-        definition="The layer of air that surrounds our planet Earth",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="pollution",
-        definition="Harmful substances that make the air, water, or land dirty",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="renewable",
-        definition="Something that can be used again or naturally replaced",
-        tier_id=3,
-        category="science",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="conservation",
-        definition="Protecting and saving natural resources for the future",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="microscope",
-        definition="A tool that makes very tiny things look much bigger",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="experiment",
-        definition="A test to find out how something works or what happens",
-        tier_id=3,
-        category="science",
-        part_of_speech="noun",
-    ),
-    # Math & Problem Solving (15 words)
-    VocabularyWord(
-        word="multiplication",
-        definition="A quick way to add the same number many times",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="division",
-        definition="Splitting a number into equal groups or parts",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="fraction",
-        definition="A part of a whole number, like half or one-fourth",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="decimal",
-        definition="A way to write parts of numbers using a dot",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="perimeter",
-        definition="The distance around the outside edge of a shape",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="area",
-        definition="The amount of space inside a flat shape",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="volume",
-        definition="The amount of space inside a three-dimensional object",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="symmetry",
-        definition="When both sides of something look exactly the same",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="angle",
-        definition="The space between two lines that meet at a point",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="coordinate",
-        definition="Numbers that tell you exactly where something is located",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="estimate",
-        definition="Make a good guess about a number without calculating exactly",
-        tier_id=3,
-        category="math",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="probability",
-        definition="The chance that something will happen or not happen",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="sequence",
-        definition="A list of numbers or things that follow a pattern",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="variable",
-        definition="A letter that stands for a number we don't know yet",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="algorithm",
-        definition="A set of steps to follow to solve a problem",
-        tier_id=3,
-        category="math",
-        part_of_speech="noun",
-    ),
-    # Social Studies & Geography (15 words)
-    VocabularyWord(
-        word="democracy",
-        definition="A government where people vote to choose their leaders",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="citizen",
-        definition="A person who belongs to a country and has rights there",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="government",
-        definition="The group of people who make laws and run a country",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="constitution",
-        definition="The most important laws that tell how a country should work",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="independence",
-        definition="When a country is free and makes its own decisions",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="colony",
-        definition="A place that is controlled by another country far away",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="explorer",
-        definition="A person who travels to discover new places",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="civilization",
-        definition="A group of people with cities, laws, and organized society",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="culture",
-        definition="The way a group of people live, including their beliefs and customs",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="tradition",
-        definition="Special customs passed down from older generations to younger ones",
-        tier_id=3,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="latitude",
-        definition="Lines on a map that run east and west to show location",
-        tier_id=3,
-        category="geography",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="longitude",
-        definition="Lines on a map that run north and south to show location",
-        tier_id=3,
-        category="geography",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hemisphere",
-        definition="Half of the Earth divided by the equator or prime meridian",
-        tier_id=3,
-        category="geography",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="climate",
-        definition="The usual weather patterns in a place over many years",
-        tier_id=3,
-        category="geography",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="landform",
-        definition="Natural features of the Earth's surface like mountains or valleys",
-        tier_id=3,
-        category="geography",
-        part_of_speech="noun",
-    ),
-    # Language Arts & Reading (15 words)
-    VocabularyWord(
-        word="narrative",
-        definition="A story that tells about events that happened",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="setting",
-        definition="When and where the events in a story take place",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="plot",
-        definition="The main events that happen in a story from beginning to end",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="conflict",
-        definition="The main problem that characters need to solve in a story",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="resolution",
-        definition="How the problem gets solved at the end of a story",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="theme",
-        definition="The important message or lesson that a story teaches",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="genre",
-        definition="The type or category of a book like mystery or fantasy",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="biography",
-        definition="A book that tells the true story of a real person's life",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="autobiography",
-        definition="A book where a person tells the story of their own life",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="fiction",
-        definition="Stories that are made up and not real",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="nonfiction",
-        definition="Books that give true information about real things",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="dialogue",
-        definition="The words that characters say to each other in a story",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="narrator",
-        definition="The person or character who tells the story",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="moral",
-        definition="An important lesson about right and wrong from a story",
-        tier_id=3,
-        category="reading",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="summarize",
-        definition="Tell the most important parts of a story in fewer words",
-        tier_id=3,
-        category="reading",
-        part_of_speech="verb",
-    ),
-    # Critical Thinking & Learning (15 words)
-    VocabularyWord(
-        word="analyze",
-        definition="Look carefully at something to understand how it works",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="evidence",
-        definition="Facts or proof that show something is true",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="conclusion",
-        definition="What you decide after thinking about all the information",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hypothesis",
-        definition="An educated guess about what might happen in an experiment",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="observation",
-        definition="Something you notice by watching carefully or using your senses",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="classify",
-        definition="Put things into groups based on what they have in common",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="predict",
-        definition="Use what you know to guess what will happen next",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="inference",
-        definition="A conclusion you reach by using clues and what you already know",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="criteria",
-        definition="The standards or rules used to judge or evaluate something",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cause",
-        definition="Something that makes another thing happen",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="effect",
-        definition="What happens as a result of something else",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="sequence",
-        definition="The order in which things happen or are arranged",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="relevant",
-        definition="Important and closely connected to what you are studying",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="interpret",
-        definition="Explain what something means or figure out its meaning",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="verb",
-    ),
-    VocabularyWord(
-        word="perspective",
-        definition="A way of looking at or thinking about something",
-        tier_id=3,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    # Health & Human Body (10 words)
-    VocabularyWord(
-        word="nutrition",
-        definition="Getting the right foods to keep your body healthy and strong",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="exercise",
-        definition="Physical activities that make your muscles and heart stronger",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hygiene",
-        definition="Keeping your body clean to stay healthy and prevent germs",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="muscles",
-        definition="Parts of your body that help you move and lift things",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="skeleton",
-        definition="All the bones in your body that give it shape and strength",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="circulation",
-        definition="How blood moves through your body to bring oxygen everywhere",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="digestion",
-        definition="How your body breaks down food to get energy and nutrients",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="respiratory",
-        definition="Related to breathing and how your lungs work",
-        tier_id=3,
-        category="health",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="immune",
-        definition="Your body's way of fighting off germs and diseases",
-        tier_id=3,
-        category="health",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="coordination",
-        definition="How well different parts of your body work together",
-        tier_id=3,
-        category="health",
-        part_of_speech="noun",
-    ),
-    # ==================== TIER 4: MIDDLE SCHOOL (Ages 11-14) - 100 words ====================
-    # Abstract concepts, detailed explanations
-    # EXISTING 10 WORDS (keeping original)
-    VocabularyWord(
-        word="democracy",
-        definition="A system of government where people vote to choose their leaders and make decisions",
-        tier_id=4,
-        category="civics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="ecosystem",
-        definition="All the living and non-living things in an area that depend on each other",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="fraction",
-        definition="A number that represents part of a whole, like 1/2 or 3/4",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="metaphor",
-        definition="A way of describing something by comparing it to something else without using 'like' or 'as'",
-        tier_id=4,
-        category="language arts",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="culture",
-        definition="The beliefs, customs, arts, and way of life of a group of people",
-        tier_id=4,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hypothesis",
-        definition="An educated guess about what will happen in a scientific experiment",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="variable",
-        definition="Something that can change or be changed in an experiment or equation",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="symbolism",
-        definition="Using objects or actions to represent deeper meanings or ideas",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="revolution",
-        definition="A complete change in the way people think about or do something",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="perspective",
-        definition="A particular way of looking at or thinking about something",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    # 90 NEW WORDS
-    # Advanced Science (20 words)
-    VocabularyWord(
-        word="mitosis",
-        definition="The process by which cells divide to create two identical new cells",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="photosynthesis",
-        definition="The complex process plants use to convert sunlight, water, and carbon dioxide into food",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="evolution",
-        definition="The gradual change in species over millions of years through natural selection",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="genetics",
-        definition="The study of how traits are passed from parents to their offspring through DNA",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="chromosome",
-        definition="Structures in cells that contain genetic information in the form of DNA",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="metabolism",
-        definition="All the chemical processes that occur in living organisms to maintain life",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="molecule",
-        definition="The smallest unit of a substance that still has all the properties of that substance",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="compound",
-        definition="A substance made of two or more different elements chemically combined together",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="catalyst",
-        definition="A substance that speeds up a chemical reaction without being changed itself",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="equilibrium",
-        definition="A state of balance where forces or influences are equally balanced",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="erosion",
-        definition="The gradual wearing away of rocks and soil by wind, water, and ice",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="sediment",
-        definition="Particles of rock, soil, and other materials carried by water or wind",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="tectonic",
-        definition="Relating to the large-scale movements of Earth's crustal plates",
-        tier_id=4,
-        category="science",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="electromagnetic",
-        definition="Relating to the interaction between electric and magnetic fields",
-        tier_id=4,
-        category="science",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="wavelength",
-        definition="The distance between two identical points in a wave pattern",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="frequency",
-        definition="The number of wave cycles that occur in a given period of time",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="velocity",
-        definition="The speed and direction of a moving object considered together",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="acceleration",
-        definition="The rate at which the velocity of an object changes over time",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="momentum",
-        definition="The quantity of motion an object has, calculated by multiplying mass and velocity",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="thermodynamics",
-        definition="The study of heat, energy, and how they relate to work and temperature",
-        tier_id=4,
-        category="science",
-        part_of_speech="noun",
-    ),
-    # Advanced Mathematics (15 words)
-    VocabularyWord(
-        word="algebra",
-        definition="A branch of mathematics that uses letters to represent unknown numbers in equations",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="geometry",
-        definition="The study of shapes, sizes, positions, and properties of space",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="polynomial",
-        definition="A mathematical expression with multiple terms involving variables and exponents",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="quadratic",
-        definition="A type of equation where the highest power of the variable is two",
-        tier_id=4,
-        category="math",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="exponential",
-        definition="A function where the variable appears as an exponent",
-        tier_id=4,
-        category="math",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="logarithm",
-        definition="The power to which a base number must be raised to get another number",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="coefficient",
-        definition="A number that multiplies a variable in an algebraic expression",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="derivative",
-        definition="A measure of how much a function changes as its input changes",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="integral",
-        definition="A mathematical concept related to the area under a curve",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="statistics",
-        definition="The collection, analysis, and interpretation of numerical data",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="correlation",
-        definition="A relationship between two variables where they tend to change together",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="median",
-        definition="The middle value in a list of numbers arranged from smallest to largest",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="deviation",
-        definition="How much individual data points differ from the average",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="regression",
-        definition="A statistical method for finding relationships between variables",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="optimization",
-        definition="Finding the best solution to a problem within given constraints",
-        tier_id=4,
-        category="math",
-        part_of_speech="noun",
-    ),
-    # Literature & Language Arts (15 words)
-    VocabularyWord(
-        word="allegory",
-        definition="A story with characters and events that represent ideas about human life or political situations",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="irony",
-        definition="The use of words to express something different from their literal meaning, often for humorous effect",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="satire",
-        definition="The use of humor, exaggeration, or ridicule to criticize people's vices or society's problems",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="alliteration",
-        definition="The repetition of the same sound at the beginning of words close together",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="onomatopoeia",
-        definition="Words that imitate the sound they represent, like 'buzz' or 'crash'",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="personification",
-        definition="Giving human characteristics to non-human things in literature",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="foreshadowing",
-        definition="Hints or clues about what will happen later in a story",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="flashback",
-        definition="A scene that interrupts the current action to show something from the past",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="climax",
-        definition="The most exciting or intense point in a story where the conflict reaches its peak",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="denouement",
-        definition="The final resolution of a story where conflicts are resolved and loose ends are tied up",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="protagonist",
-        definition="The main character in a story who faces the central conflict",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="antagonist",
-        definition="The character or force that opposes the main character in a story",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="archetype",
-        definition="A universal symbol, character type, or theme that appears across different cultures and stories",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="rhetoric",
-        definition="The art of effective and persuasive speaking and writing",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="etymology",
-        definition="The study of the origin and historical development of words",
-        tier_id=4,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    # Social Studies & History (15 words)
-    VocabularyWord(
-        word="feudalism",
-        definition="A medieval system where nobles granted land to vassals in exchange for military service",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="renaissance",
-        definition="A period of renewed interest in art, learning, and culture in Europe from 1300-1600",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="imperialism",
-        definition="A policy of extending a country's power through colonization or military force",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="nationalism",
-        definition="Strong identification with and support for one's own nation and its interests",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="industrialization",
-        definition="The development of industries in a country or region on a large scale",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="urbanization",
-        definition="The process of people moving from rural areas to cities",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="totalitarianism",
-        definition="A system of government with complete control over all aspects of public and private life",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="propaganda",
-        definition="Information designed to promote a particular political cause or point of view",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="diplomacy",
-        definition="The practice of conducting negotiations between nations to maintain peaceful relationships",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="alliance",
-        definition="A formal agreement between countries to support each other militarily or politically",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="sovereignty",
-        definition="The authority of a nation to govern itself without external interference",
-        tier_id=4,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="amendment",
-        definition="A formal change or addition to a constitution or law",
-        tier_id=4,
-        category="civics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="precedent",
-        definition="An earlier decision or action that serves as a guide for future similar situations",
-        tier_id=4,
-        category="civics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="jurisdiction",
-        definition="The official power to make legal decisions and judgments in a specific area",
-        tier_id=4,
-        category="civics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="checks and balances",
-        definition="A system that ensures no single branch of government becomes too powerful",
-        tier_id=4,
-        category="civics",
-        part_of_speech="noun",
-    ),
-    # Psychology & Human Behavior (10 words)
-    VocabularyWord(
-        word="adolescence",
-        definition="The period of development between childhood and adulthood involving physical and emotional changes",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="identity",
-        definition="A person's sense of who they are based on their beliefs, values, and experiences",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="stereotype",
-        definition="An oversimplified generalization about a particular group of people",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="prejudice",
-        definition="Preconceived negative opinions about people based on their group membership",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="empathy",
-        definition="The ability to understand and share the feelings of another person",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="motivation",
-        definition="The internal drive or external factors that cause a person to take action",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="perception",
-        definition="How individuals interpret and make sense of sensory information",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cognitive",
-        definition="Relating to mental processes like thinking, learning, and remembering",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="subconscious",
-        definition="Mental processes that occur below the level of conscious awareness",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="resilience",
-        definition="The ability to recover quickly from difficulties and adapt to challenging situations",
-        tier_id=4,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    # Critical Thinking & Philosophy (15 words)
-    VocabularyWord(
-        word="logic",
-        definition="A system of reasoning that follows clear principles to reach valid conclusions",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="fallacy",
-        definition="A mistaken belief or flawed reasoning that leads to invalid conclusions",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="objective",
-        definition="Based on facts and not influenced by personal feelings or opinions",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="subjective",
-        definition="Based on personal feelings, opinions, and interpretations rather than facts",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="bias",
-        definition="A tendency to favor one thing, person, or group over another in an unfair way",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="skepticism",
-        definition="An attitude of doubting claims until sufficient evidence is provided",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="empirical",
-        definition="Based on observation and experience rather than theory or pure logic",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="deductive",
-        definition="Reasoning from general principles to reach specific conclusions",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="inductive",
-        definition="Reasoning from specific observations to reach general conclusions",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="synthesis",
-        definition="Combining different ideas or pieces of information to create something new",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="paradigm",
-        definition="A typical example or model that serves as a pattern for understanding concepts",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="abstract",
-        definition="Existing as an idea or concept rather than a physical object",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="inherent",
-        definition="Existing as a natural or basic part of something",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="paradox",
-        definition="A statement that seems contradictory but may actually express a deeper truth",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="ambiguous",
-        definition="Having more than one possible meaning or interpretation",
-        tier_id=4,
-        category="thinking",
-        part_of_speech="adjective",
-    ),
-    # ==================== TIER 5: HIGH SCHOOL (Ages 15-18) - 100 words ====================
-    # Advanced academic vocabulary, comprehensive explanations
-    # EXISTING 10 WORDS (keeping original)
-    VocabularyWord(
-        word="paradigm",
-        definition="A typical example or model that serves as a pattern for understanding concepts",
-        tier_id=5,
-        category="academic",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="synthesis",
-        definition="The combination of separate elements or ideas to form a connected whole",
-        tier_id=5,
-        category="academic",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="rhetoric",
-        definition="The art of effective or persuasive speaking and writing, especially in public",
-        tier_id=5,
-        category="language arts",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="globalization",
-        definition="The process by which businesses and cultures develop international influence",
-        tier_id=5,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="catalyst",
-        definition="Something that causes or accelerates a change or reaction",
-        tier_id=5,
-        category="science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="allegory",
-        definition="A story with hidden meaning where characters represent ideas or principles",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="autonomous",
-        definition="Having the freedom to act independently and make one's own decisions",
-        tier_id=5,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="empirical",
-        definition="Based on observation and experience rather than theory or pure logic",
-        tier_id=5,
-        category="science",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="ideology",
-        definition="A system of ideas and beliefs that forms the basis of political or economic theory",
-        tier_id=5,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="juxtaposition",
-        definition="Placing two contrasting elements side by side to highlight their differences",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    # 90 NEW WORDS
-    # Advanced Sciences (20 words)
-    VocabularyWord(
-        word="stoichiometry",
-        definition="The calculation of quantities in chemical reactions based on balanced equations",
-        tier_id=5,
-        category="chemistry",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="entropy",
-        definition="A measure of disorder or randomness in a system, especially in thermodynamics",
-        tier_id=5,
-        category="physics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="homeostasis",
-        definition="The tendency of biological systems to maintain stable internal conditions",
-        tier_id=5,
-        category="biology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="electronegativity",
-        definition="The tendency of an atom to attract electrons when forming chemical bonds",
-        tier_id=5,
-        category="chemistry",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="quantum",
-        definition="The smallest discrete unit of energy, relating to subatomic particle behavior",
-        tier_id=5,
-        category="physics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="isotope",
-        definition="Atoms of the same element with different numbers of neutrons",
-        tier_id=5,
-        category="chemistry",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="osmosis",
-        definition="The movement of water through a semipermeable membrane from low to high solute concentration",
-        tier_id=5,
-        category="biology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="allele",
-        definition="One of two or more alternative forms of a gene that arise by mutation",
-        tier_id=5,
-        category="biology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="phenotype",
-        definition="The observable characteristics of an organism resulting from gene expression",
-        tier_id=5,
-        category="biology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="genotype",
-        definition="The genetic makeup of an organism, represented by its DNA sequence",
-        tier_id=5,
-        category="biology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="covalent",
-        definition="A type of chemical bond formed by the sharing of electrons between atoms",
-        tier_id=5,
-        category="chemistry",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="ionic",
-        definition="A type of chemical bond formed by the transfer of electrons between atoms",
-        tier_id=5,
-        category="chemistry",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="kinetic",
-        definition="Relating to the motion of objects and the forces associated with motion",
-        tier_id=5,
-        category="physics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="potential",
-        definition="Stored energy that has the capacity to do work due to position or condition",
-        tier_id=5,
-        category="physics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="electromagnetic",
-        definition="Relating to the interrelated electric and magnetic fields and their effects",
-        tier_id=5,
-        category="physics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="radioactive",
-        definition="Exhibiting or caused by radioactivity; emitting ionizing radiation spontaneously",
-        tier_id=5,
-        category="chemistry",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="aerobic",
-        definition="Requiring oxygen to function, particularly in cellular respiration processes",
-        tier_id=5,
-        category="biology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="anaerobic",
-        definition="Occurring without oxygen, as in certain metabolic processes",
-        tier_id=5,
-        category="biology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="biodiversity",
-        definition="The variety of life forms in an ecosystem, including genetic, species, and ecological diversity",
-        tier_id=5,
-        category="biology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="sustainability",
-        definition="The ability to maintain ecological balance by avoiding depletion of natural resources",
-        tier_id=5,
-        category="environmental science",
-        part_of_speech="noun",
-    ),
-    # Advanced Mathematics & Statistics (15 words)
-    VocabularyWord(
-        word="calculus",
-        definition="A branch of mathematics dealing with derivatives, integrals, and limits of functions",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="trigonometry",
-        definition="The study of relationships between angles and sides of triangles",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="asymptote",
-        definition="A line that a curve approaches but never quite reaches as it extends to infinity",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="parabola",
-        definition="A symmetrical open curve formed by the intersection of a cone with a plane",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hyperbola",
-        definition="A type of smooth curve formed by the intersection of a cone with a plane",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="matrix",
-        definition="A rectangular array of numbers arranged in rows and columns for mathematical operations",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="vector",
-        definition="A quantity having both magnitude and direction, represented by an arrow",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="differential",
-        definition="An infinitesimal change in a variable or function",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="integral",
-        definition="A mathematical concept representing the area under a curve or antiderivative",
-        tier_id=5,
-        category="mathematics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="probability",
-        definition="The mathematical measure of the likelihood that an event will occur",
-        tier_id=5,
-        category="statistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="distribution",
-        definition="A function that describes the likelihood of different outcomes in a dataset",
-        tier_id=5,
-        category="statistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="correlation",
-        definition="A statistical measure of the linear relationship between two variables",
-        tier_id=5,
-        category="statistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="regression",
-        definition="A statistical method for modeling relationships between dependent and independent variables",
-        tier_id=5,
-        category="statistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hypothesis",
-        definition="A testable prediction about the relationship between variables in statistical analysis",
-        tier_id=5,
-        category="statistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="significance",
-        definition="The probability that observed results are not due to random chance",
-        tier_id=5,
-        category="statistics",
-        part_of_speech="noun",
-    ),
-    # Literature & Advanced Language Arts (15 words)
-    VocabularyWord(
-        word="vernacular",
-        definition="The language or dialect spoken by ordinary people in a particular country or region",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="dichotomy",
-        definition="A division or contrast between two things that are represented as opposed or contradictory",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="euphemism",
-        definition="A mild or indirect term substituted for one considered too harsh or direct",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hyperbole",
-        definition="Deliberate and obvious exaggeration used for emphasis or dramatic effect",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="oxymoron",
-        definition="A combination of contradictory words used for rhetorical effect",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="chiasmus",
-        definition="A rhetorical device where clauses are repeated in reverse order",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="anaphora",
-        definition="The repetition of a word or phrase at the beginning of successive clauses",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="epistolary",
-        definition="A literary work written in the form of letters or diary entries",
-        tier_id=5,
-        category="literature",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="soliloquy",
-        definition="A dramatic device where a character speaks thoughts aloud while alone",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="catharsis",
-        definition="The emotional release experienced by the audience of a dramatic work",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="bildungsroman",
-        definition="A literary genre focused on the psychological and moral growth of a protagonist",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="dystopian",
-        definition="Relating to an imagined society where everything is unpleasant or bad",
-        tier_id=5,
-        category="literature",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="utopian",
-        definition="Relating to an imagined perfect society where everything is ideal",
-        tier_id=5,
-        category="literature",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="stream of consciousness",
-        definition="A narrative technique that presents thoughts and feelings as continuous flow",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="motif",
-        definition="A recurring element, theme, or symbol that has symbolic significance in a literary work",
-        tier_id=5,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    # Social Sciences & History (15 words)
-    VocabularyWord(
-        word="hegemony",
-        definition="Leadership or dominance, especially by one state or social group over others",
-        tier_id=5,
-        category="social studies",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="capitalism",
-        definition="An economic system based on private ownership and free market competition",
-        tier_id=5,
-        category="economics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="socialism",
-        definition="An economic system where means of production are owned collectively or by government",
-        tier_id=5,
-        category="economics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="colonialism",
-        definition="The practice of acquiring political control over another country and exploiting it economically",
-        tier_id=5,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="postcolonialism",
-        definition="The study of cultural, political, and economic effects of colonialism and decolonization",
-        tier_id=5,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="secularization",
-        definition="The transformation of society from close identification with religious institutions to non-religious values",
-        tier_id=5,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="stratification",
-        definition="The arrangement of social groups in a hierarchy based on wealth, power, or status",
-        tier_id=5,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="meritocracy",
-        definition="A system where advancement is based on individual ability and achievement",
-        tier_id=5,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="oligarchy",
-        definition="A form of government where power is held by a small number of people",
-        tier_id=5,
-        category="political science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="bureaucracy",
-        definition="A system of government characterized by specialized departments and hierarchical authority",
-        tier_id=5,
-        category="political science",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="diaspora",
-        definition="The dispersion of people from their original homeland to other parts of the world",
-        tier_id=5,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="renaissance",
-        definition="A period of renewed interest in classical learning, art, and culture",
-        tier_id=5,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="enlightenment",
-        definition="An intellectual movement emphasizing reason, individualism, and skepticism of traditional authority",
-        tier_id=5,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="romanticism",
-        definition="An artistic and intellectual movement emphasizing emotion, nature, and individualism",
-        tier_id=5,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="modernism",
-        definition="A cultural movement characterized by deliberate departure from traditional forms",
-        tier_id=5,
-        category="history",
-        part_of_speech="noun",
-    ),
-    # Philosophy & Critical Thinking (15 words)
-    VocabularyWord(
-        word="epistemology",
-        definition="The branch of philosophy concerned with the theory of knowledge and how we know things",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="ontology",
-        definition="The philosophical study of the nature of being, existence, and reality",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="metaphysics",
-        definition="The branch of philosophy dealing with the fundamental nature of reality",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="existentialism",
-        definition="A philosophical theory emphasizing individual existence, freedom, and choice",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="nihilism",
-        definition="The philosophical belief that life is without objective meaning or intrinsic value",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="determinism",
-        definition="The doctrine that all events are the result of previously existing causes",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="relativism",
-        definition="The doctrine that knowledge, truth, and morality are relative to contexts",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="pragmatism",
-        definition="A philosophical approach that evaluates theories based on their practical consequences",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="dialectical",
-        definition="Relating to logical discussion aimed at resolving contradictions",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="syllogism",
-        definition="A form of logical reasoning consisting of a major premise, minor premise, and conclusion",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="tautology",
-        definition="A statement that is true by necessity or by virtue of its logical form",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="paradox",
-        definition="A seemingly contradictory statement that may nonetheless express a possible truth",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="sophistry",
-        definition="The use of fallacious arguments with the intent to deceive",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="teleological",
-        definition="Relating to or involving the explanation of phenomena by their purposes rather than causes",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="categorical",
-        definition="Unconditionally assertive; without exceptions or conditions",
-        tier_id=5,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    # Psychology & Human Behavior (10 words)
-    VocabularyWord(
-        word="psychoanalysis",
-        definition="A therapeutic approach developed by Freud focusing on unconscious mental processes",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="behaviorism",
-        definition="A psychological approach that focuses on observable behaviors rather than mental processes",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cognitive dissonance",
-        definition="Mental discomfort experienced when holding contradictory beliefs or attitudes",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="intrinsic",
-        definition="Belonging naturally; essential; motivated by internal satisfaction rather than external rewards",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="extrinsic",
-        definition="Coming from outside; motivated by external rewards or pressures",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="neuroplasticity",
-        definition="The brain's ability to reorganize and form new neural connections throughout life",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="attribution",
-        definition="The process of explaining the causes of behavior and events",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="conformity",
-        definition="The tendency to align attitudes, beliefs, and behaviors with group norms",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="altruism",
-        definition="Selfless concern for the well-being of others without expectation of reward",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="extraversion",
-        definition="A personality trait characterized by outgoingness, sociability, and assertiveness",
-        tier_id=5,
-        category="psychology",
-        part_of_speech="noun",
-    ),
-    # ==================== TIER 6: ADULT (Ages 18+) - 100 words ====================
-    # Professional and sophisticated vocabulary, full academic definitions
-    # EXISTING 10 WORDS (keeping original)
-    VocabularyWord(
-        word="ubiquitous",
-        definition="Present, appearing, or found everywhere; omnipresent in a pervasive manner",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="etymology",
-        definition="The study of the origin and historical development of words and their meanings",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="epistemology",
-        definition="The branch of philosophy concerned with the theory of knowledge and justified belief",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hegemony",
-        definition="Leadership or dominance, especially by one social group over others",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="nomenclature",
-        definition="The devising or choosing of names for things, especially in scientific classification",
-        tier_id=6,
-        category="academic",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="paradigmatic",
-        definition="Serving as a typical example or model of something; representative of a paradigm",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="hermeneutics",
-        definition="The method and theory of interpretation, especially of scriptural and literary texts",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="ontological",
-        definition="Relating to the nature of being, existence, or reality as a philosophical concept",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="phenomenology",
-        definition="The philosophical study of structures of experience and consciousness",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="teleological",
-        definition="Relating to or involving the explanation of phenomena by their purposes rather than causes",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    # 90 NEW WORDS
-    # Advanced Philosophy & Theory (20 words)
-    VocabularyWord(
-        word="epistemological",
-        definition="Relating to the nature of knowledge, its presuppositions, foundations, and validity",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="metaphysical",
-        definition="Relating to the transcendent or supersensible realm beyond physical existence",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="dialectical",
-        definition="Relating to logical discussion aimed at resolving contradictions through reasoned argument",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="phenomenological",
-        definition="Relating to the philosophical study of consciousness and lived experience",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="existentialist",
-        definition="Relating to a philosophy emphasizing individual existence, freedom, and authentic choice",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="postmodernism",
-        definition="A late 20th-century movement characterized by skepticism toward grand narratives and ideologies",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="deconstructionism",
-        definition="A method of critical analysis that seeks to expose underlying assumptions in texts",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="structuralism",
-        definition="An analytical method based on studying underlying structures that shape human culture",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="semiotics",
-        definition="The study of signs and symbols and their use or interpretation in communication",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="hermeneutical",
-        definition="Relating to the methodology of interpretation, especially of biblical or literary texts",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="axiological",
-        definition="Relating to the philosophical study of values and value judgments",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="sophism",
-        definition="A plausible but fallacious argument used to deceive or display ingenuity in reasoning",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="solipsism",
-        definition="The philosophical view that only one's own mind is sure to exist",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="materialism",
-        definition="The philosophical doctrine that nothing exists except matter and its movements",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="dualism",
-        definition="The philosophical division of reality into two fundamental kinds of substance or principle",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="monism",
-        definition="The philosophical view that all existing things can be ascribed to a single substance",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="empiricism",
-        definition="The philosophical theory that all knowledge is derived from sensory experience",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="rationalism",
-        definition="The philosophical view that regards reason as the chief source of knowledge",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="cartesian",
-        definition="Relating to the philosophical and mathematical system of René Descartes",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="transcendental",
-        definition="Relating to spiritual or non-physical realm; surpassing ordinary limits",
-        tier_id=6,
-        category="philosophy",
-        part_of_speech="adjective",
-    ),
-    # Advanced Linguistics & Literature (15 words)
-    VocabularyWord(
-        word="morphological",
-        definition="Relating to the form and structure of words and their meaningful components",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="phonological",
-        definition="Relating to the sound systems of language and their systematic organization",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="syntactic",
-        definition="Relating to the arrangement of words and phrases to create well-formed sentences",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="semantic",
-        definition="Relating to meaning in language, logic, or other symbolic systems",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="pragmatic",
-        definition="Relating to the practical aspects of language use in social contexts",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="diachronic",
-        definition="Relating to the study of linguistic or literary changes over time",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="synchronic",
-        definition="Relating to the study of linguistic phenomena at a particular point in time",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="polysemy",
-        definition="The coexistence of multiple related meanings for a single word",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="homophony",
-        definition="The quality of having the same pronunciation as another word but different meaning",
-        tier_id=6,
-        category="linguistics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="intertextuality",
-        definition="The relationship between texts and how they reference or influence each other",
-        tier_id=6,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="metafiction",
-        definition="Fiction that self-consciously addresses the devices of fiction and the nature of storytelling",
-        tier_id=6,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="verisimilitude",
-        definition="The appearance of being true or real; likelihood of truth in artistic representation",
-        tier_id=6,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="anachronism",
-        definition="A thing belonging to a period other than that in which it exists",
-        tier_id=6,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="pastiche",
-        definition="An artistic work that imitates the style of previous works",
-        tier_id=6,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="palimpsest",
-        definition="A manuscript page from which earlier writing has been erased to make room for later writing",
-        tier_id=6,
-        category="literature",
-        part_of_speech="noun",
-    ),
-    # Advanced Social Sciences (15 words)
-    VocabularyWord(
-        word="ethnography",
-        definition="The systematic study of people and cultures through direct observation and participation",
-        tier_id=6,
-        category="anthropology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="anthropological",
-        definition="Relating to the scientific study of humanity, culture, and social relationships",
-        tier_id=6,
-        category="anthropology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="sociological",
-        definition="Relating to the study of society and social behavior patterns",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="historiography",
-        definition="The study of historical writing and the methods used by historians",
-        tier_id=6,
-        category="history",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="epistemological",
-        definition="Relating to the study of knowledge, its nature, sources, and validity",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="positivism",
-        definition="A philosophical system recognizing only empirically verifiable phenomena",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="constructivism",
-        definition="The theory that knowledge and meaning are constructed through social interaction",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="functionalism",
-        definition="A sociological perspective viewing society as a complex system of interrelated parts",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="structuralism",
-        definition="An approach to understanding culture through underlying structural relationships",
-        tier_id=6,
-        category="anthropology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="poststructuralism",
-        definition="A theoretical movement that challenges the stability of meaning and systematic knowledge",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="commodification",
-        definition="The transformation of goods, services, or ideas into market commodities",
-        tier_id=6,
-        category="economics",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="marginalization",
-        definition="The social process of becoming or being made marginal or relegated to the fringe",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="stratification",
-        definition="The hierarchical arrangement of social classes or groups within a society",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="bureaucratization",
-        definition="The process of becoming controlled by or organized according to bureaucratic principles",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="secularization",
-        definition="The transformation of society from close identification with religious values to non-religious values",
-        tier_id=6,
-        category="sociology",
-        part_of_speech="noun",
-    ),
-    # Advanced Science & Research (15 words)
-    VocabularyWord(
-        word="methodology",
-        definition="A system of methods used in a particular area of study or activity",
-        tier_id=6,
-        category="research",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="quantitative",
-        definition="Relating to measurement of quantity or amount, often involving statistical analysis",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="qualitative",
-        definition="Relating to qualities or characteristics rather than quantities or amounts",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="longitudinal",
-        definition="Involving the observation of the same subjects over a period of time",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="cross-sectional",
-        definition="Analyzing data from a population at a single point in time",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="statistical",
-        definition="Relating to the collection, analysis, and interpretation of numerical data",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="correlational",
-        definition="Relating to a mutual relationship between two or more variables",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="experimental",
-        definition="Based on or derived from controlled scientific experiment and observation",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="theoretical",
-        definition="Concerned with or involving theory rather than practical application",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="empirical",
-        definition="Based on observation and experiment rather than theory",
-        tier_id=6,
-        category="research",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="replication",
-        definition="The action of copying or reproducing something, especially in scientific research",
-        tier_id=6,
-        category="research",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="falsifiability",
-        definition="The logical possibility that an assertion can be shown false by observation or experiment",
-        tier_id=6,
-        category="research",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="operationalization",
-        definition="The process of defining abstract concepts in terms of measurable phenomena",
-        tier_id=6,
-        category="research",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="randomization",
-        definition="The process of making selections in a random manner for experimental control",
-        tier_id=6,
-        category="research",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="triangulation",
-        definition="The use of multiple methods or data sources to study a single phenomenon",
-        tier_id=6,
-        category="research",
-        part_of_speech="noun",
-    ),
-    # Professional & Business (10 words)
-    VocabularyWord(
-        word="paradigmatic",
-        definition="Serving as a typical example or pattern; exemplifying a particular paradigm",
-        tier_id=6,
-        category="business",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="optimization",
-        definition="The action of making the best or most effective use of resources or situations",
-        tier_id=6,
-        category="business",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="synergistic",
-        definition="Relating to the interaction of elements that produce a combined effect greater than individual effects",
-        tier_id=6,
-        category="business",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="entrepreneurial",
-        definition="Characterized by initiative and willingness to undertake new ventures",
-        tier_id=6,
-        category="business",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="scalability",
-        definition="The capability to handle a growing amount of work in a graceful manner",
-        tier_id=6,
-        category="business",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="diversification",
-        definition="The process of varying products, investments, or activities to reduce risk",
-        tier_id=6,
-        category="business",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="consolidation",
-        definition="The action of combining or uniting separate elements into a single whole",
-        tier_id=6,
-        category="business",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="procurement",
-        definition="The action of obtaining or acquiring goods, services, or works from an external source",
-        tier_id=6,
-        category="business",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="stakeholder",
-        definition="A person or group with an interest in or concern for a particular organization",
-        tier_id=6,
-        category="business",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="fiduciary",
-        definition="Relating to a person or organization acting on behalf of another in financial matters",
-        tier_id=6,
-        category="business",
-        part_of_speech="adjective",
-    ),
-    # Advanced Academic & Intellectual (15 words)
-    VocabularyWord(
-        word="juxtaposition",
-        definition="The fact of placing two things side by side, typically for contrasting effect",
-        tier_id=6,
-        category="academic",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="dichotomous",
-        definition="Divided or dividing into two mutually exclusive or contradictory groups",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="heterogeneous",
-        definition="Diverse in character or content; consisting of dissimilar elements",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="homogeneous",
-        definition="Of the same kind; alike; uniform in structure or composition throughout",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="ubiquity",
-        definition="The state of being everywhere at once or seeming to be everywhere simultaneously",
-        tier_id=6,
-        category="academic",
-        part_of_speech="noun",
-    ),
-    VocabularyWord(
-        word="quintessential",
-        definition="Representing the most perfect example of a quality or class",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="idiosyncratic",
-        definition="Relating to idiosyncrasy; peculiar to an individual person",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="anachronistic",
-        definition="Belonging to a period other than that being portrayed",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="ephemeral",
-        definition="Lasting for a very short time; transitory in nature",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="immutable",
-        definition="Unchanging over time; unable to be changed",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="ineffable",
-        definition="Too great or extreme to be expressed in words",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="inscrutable",
-        definition="Impossible to understand or interpret; mysterious",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="perfunctory",
-        definition="Carried out with minimum effort or reflection; superficial",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="perspicacious",
-        definition="Having keen insight; mentally sharp and discerning",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-    VocabularyWord(
-        word="surreptitious",
-        definition="Kept secret, especially because it would not be approved of",
-        tier_id=6,
-        category="academic",
-        part_of_speech="adjective",
-    ),
-]
+
+def load_expanded_vocabulary():
+    """Return the seed words as unsaved VocabularyWord objects"""
+    from models import VocabularyWord
+
+    return [VocabularyWord(**row) for row in iter_seed_file(EXPANDED_VOCABULARY)]
+
+
+def __getattr__(name):
+    if name == "expanded_vocabulary":
+        return load_expanded_vocabulary()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,31 @@
+"""
+Gunicorn settings for Bolaquent: gunicorn -c gunicorn.conf.py wsgi:app
+
+Pre-forked workers, each with a few threads (gthread), so slow requests such as
+exports do not hold up a whole process. The app is preloaded in the master (see
+wsgi.py) and workers are recycled after MAX_REQUESTS to bound memory growth.
+Every setting can be overridden from the environment.
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.environ.get('FLASK_HOST', '0.0.0.0')}:{os.environ.get('PORT', 5000)}"
+
+# (2 x CPUs) + 1 processes; each keeps its own DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW),
+# which must stay at or above the thread count
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+
+preload_app = True
+max_requests = int(os.environ.get("MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("MAX_REQUESTS_JITTER", 100))
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = 30
+keepalive = 5  # seconds; nginx reuses connections to the app
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
@@ -1,9 +1,20 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-from sqlalchemy import Text, Integer, String, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Text, Integer, String, DateTime, Float, Boolean, ForeignKey, Index
+from sqlalchemy.orm import relationship, validates
 
-db = SQLAlchemy()
+from utils.routing import RoutingSession
+
+db = SQLAlchemy(session_options={"class_": RoutingSession})
+
+
+def normalize_word(word):
+    """Case- and whitespace-insensitive key used to keep words unique within a tier"""
+    return word.strip().lower() if word is not None else None
+
+
+def _default_word_key(context):
+    return normalize_word(context.get_current_parameters().get("word"))
 
 
 class AgeTier(db.Model):
@@ -47,20 +58,30 @@ class User(db.Model):
 
 class VocabularyWord(db.Model):
     __tablename__ = "vocabulary_words"
+    __table_args__ = (
+        # Dedup for expansion and admin inserts: conflicting rows are skipped or rejected
+        Index("uq_vocabulary_words_tier_word_key", "tier_id", "word_key", unique=True),
+    )
 
     id = db.Column(Integer, primary_key=True)
     word = db.Column(String(100), nullable=False)
+    word_key = db.Column(String(100), default=_default_word_key)  # normalize_word(word)
     definition = db.Column(Text, nullable=False)
     pronunciation = db.Column(String(200))
     part_of_speech = db.Column(String(50))
     difficulty_level = db.Column(Integer, default=1)
-    tier_id = db.Column(Integer, ForeignKey("age_tiers.id"))
+    tier_id = db.Column(Integer, ForeignKey("age_tiers.id"), index=True)
     category = db.Column(String(100))  # e.g., 'animals', 'colors', 'actions'
 
     # Relationships
     age_tier = relationship("AgeTier", back_populates="vocabulary_words")
     progress_records = relationship("UserProgress", back_populates="vocabulary_word")
 
+    @validates("word")
+    def _sync_word_key(self, key, word):
+        self.word_key = normalize_word(word)
+        return word
+
     def __repr__(self):
         return f"<VocabularyWord {self.word}>"
 
@@ -100,6 +121,14 @@ class LearningActivity(db.Model):
 
 class UserProgress(db.Model):
     __tablename__ = "user_progress"
+    __table_args__ = (
+        # One progress row per user and word; also serves the per-answer lookup
+        Index("uq_user_progress_user_word", "user_id", "vocabulary_word_id", unique=True),
+        # Mastered-word counts on the dashboard and achievements pages
+        Index("ix_user_progress_user_mastery", "user_id", "mastery_level"),
+        # Due-for-review scans
+        Index("ix_user_progress_user_next_review", "user_id", "next_review_date"),
+    )
 
     id = db.Column(Integer, primary_key=True)
     user_id = db.Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -113,6 +142,11 @@ class UserProgress(db.Model):
     last_practiced = db.Column(DateTime, default=datetime.utcnow)
     next_review_date = db.Column(DateTime)
 
+    # Spaced-repetition state (see utils/scheduler.py)
+    ease_factor = db.Column(Float)
+    interval_days = db.Column(Integer)
+    repetitions = db.Column(Integer)
+
     # Relationships
     user = relationship("User", back_populates="progress_records")
     vocabulary_word = relationship("VocabularyWord", back_populates="progress_records")
@@ -121,6 +155,24 @@ class UserProgress(db.Model):
         return f"<UserProgress User:{self.user_id} Word:{self.vocabulary_word_id}>"
 
 
+class UserStats(db.Model):
+    """Per-user progress summary maintained incrementally (see utils/stats.py)"""
+
+    __tablename__ = "user_stats"
+
+    user_id = db.Column(Integer, ForeignKey("users.id"), primary_key=True)
+    tier_id = db.Column(Integer, ForeignKey("age_tiers.id"), index=True)
+    total_words = db.Column(Integer, default=0)  # vocabulary size of the user's tier
+    mastered_count = db.Column(Integer, default=0)
+    attempts = db.Column(Integer, default=0)
+    correct_answers = db.Column(Integer, default=0)
+    last_practiced = db.Column(DateTime)
+    updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<UserStats User:{self.user_id}>"
+
+
 class GamificationElement(db.Model):
     __tablename__ = "gamification_elements"
 
@@ -135,3 +187,37 @@ class GamificationElement(db.Model):
 
     def __repr__(self):
         return f"<GamificationElement {self.name}>"
+
+
+class BackgroundJob(db.Model):
+    """Persisted state of a long-running admin task (see utils/jobs.py)"""
+
+    __tablename__ = "background_jobs"
+
+    id = db.Column(Integer, primary_key=True)
+    kind = db.Column(String(50), nullable=False, index=True)  # e.g. 'expand_vocabulary'
+    status = db.Column(String(20), nullable=False, default="queued")
+    progress = db.Column(Text)  # JSON string of job-specific progress
+    result = db.Column(Text)  # JSON string of the job's return value
+    error = db.Column(Text)
+    cancel_requested = db.Column(Boolean, nullable=False, default=False)
+    created_at = db.Column(DateTime, default=datetime.utcnow)
+    started_at = db.Column(DateTime)
+    updated_at = db.Column(DateTime)
+    finished_at = db.Column(DateTime)
+
+    def __repr__(self):
+        return f"<BackgroundJob {self.kind} #{self.id} {self.status}>"
+
+
+class AppMetadata(db.Model):
+    """Key/value facts about the database itself, such as the applied seed hash"""
+
+    __tablename__ = "app_metadata"
+
+    key = db.Column(String(100), primary_key=True)
+    value = db.Column(Text)
+    updated_at = db.Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AppMetadata {self.key}>"
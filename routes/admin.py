@@ -1,41 +1,193 @@
-from flask import Blueprint, render_template, request, redirect, url_for, flash
-from models import db, VocabularyWord, AgeTier, User
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    flash,
+    jsonify,
+    redirect,
+    render_template,
+    request,
+    session,
+    stream_with_context,
+    url_for,
+)
+from datetime import datetime
+import csv
+import io
+import json
+from functools import wraps
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from models import db, BackgroundJob, VocabularyWord, AgeTier, User
+from utils.cache import get_cache, invalidate_vocabulary
+from utils.database import app_engines, pool_status
+from utils.jobs import find_active_job, get_job_runner, job_to_dict, request_cancel
+from utils.routing import read_only
+from utils.stats import refresh_tier_totals
 
 bp = Blueprint("admin", __name__, url_prefix="/admin")
 
 
-@bp.route("/")
-def dashboard():
-    # Simple admin dashboard
-    total_users = User.query.count()
+ADMIN_STATS_KEY = "admin_stats"
+EXPANSION_JOB = "expand_vocabulary"
+
+
+def admin_required(view):
+    """Allow only registered users listed in ADMIN_USERNAMES (no guest or demo sessions)"""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        user_id = session.get("user_id")
+        if session.get("is_guest") or session.get("is_demo") or not isinstance(user_id, int):
+            abort(403)
+        user = db.session.get(User, user_id)
+        if user is None or user.username not in current_app.config["ADMIN_USERNAMES"]:
+            abort(403)
+        return view(*args, **kwargs)
+
+    return wrapper
+
 
-    stats = {
-        "total_users": total_users,
-        "total_words": VocabularyWord.query.count(),
+def _compute_stats():
+    """Build dashboard stats with one grouped query over tiers and user counts"""
+    user_counts = (
+        db.select(User.tier_id, func.count().label("user_count")).group_by(User.tier_id).subquery()
+    )
+    total_users = db.select(func.count()).select_from(User).scalar_subquery()
+    total_words = db.select(func.count()).select_from(VocabularyWord).scalar_subquery()
+
+    rows = db.session.execute(
+        db.select(
+            AgeTier.name,
+            AgeTier.min_age,
+            AgeTier.max_age,
+            func.coalesce(user_counts.c.user_count, 0),
+            total_users,
+            total_words,
+        )
+        .outerjoin(user_counts, user_counts.c.tier_id == AgeTier.id)
+        .order_by(AgeTier.id)
+    ).all()
+    if rows:
+        totals = rows[0][4:]
+    else:
+        totals = db.session.execute(db.select(total_users, total_words)).one()
+
+    return {
+        "total_users": totals[0],
+        "total_words": totals[1],
         "active_sessions": 1,  # Placeholder
         "total_practice_sessions": 10,  # Placeholder
-        "tier_distribution": [],
+        "tier_distribution": [
+            {"name": name, "age_range": f"{min_age}-{max_age}", "user_count": user_count}
+            for name, min_age, max_age, user_count, _, _ in rows
+        ],
+        "computed_at": datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
+    }
+
+
+@bp.route("/")
+@read_only
+def dashboard():
+    # Stats are materialized for ADMIN_STATS_TTL seconds; ?refresh=1 recomputes
+    cache = get_cache()
+    stats = None if request.args.get("refresh") else cache.get(ADMIN_STATS_KEY)
+    if stats is None:
+        stats = _compute_stats()
+        cache.set(ADMIN_STATS_KEY, stats, current_app.config["ADMIN_STATS_TTL"])
+
+    job_id = request.args.get("job", type=int)
+    job = db.session.get(BackgroundJob, job_id) if job_id else find_active_job(EXPANSION_JOB)
+    return render_template("admin/dashboard.html", stats=stats, expansion_job=job)
+
+
+WORD_FILTERS = {
+    "tier_id": (VocabularyWord.tier_id, int),
+    "category": (VocabularyWord.category, str),
+    "part_of_speech": (VocabularyWord.part_of_speech, str),
+    "difficulty": (VocabularyWord.difficulty_level, int),
+}
+
+
+def _page_size(args):
+    per_page = args.get("per_page", type=int) or current_app.config["ADMIN_PAGE_SIZE"]
+    return max(1, min(per_page, current_app.config["ADMIN_MAX_PAGE_SIZE"]))
+
+
+def _keyset_page(query, id_column, args):
+    """Page a query by ascending id, following ?after= or ?before= cursors"""
+    per_page = _page_size(args)
+    after = args.get("after", type=int)
+    before = args.get("before", type=int)
+
+    if before is not None:
+        rows = query.filter(id_column < before).order_by(id_column.desc()).limit(per_page + 1).all()
+        has_previous = len(rows) > per_page
+        items = list(reversed(rows[:per_page]))
+        has_next = True
+    else:
+        if after is not None:
+            query = query.filter(id_column > after)
+        rows = query.order_by(id_column).limit(per_page + 1).all()
+        has_next = len(rows) > per_page
+        items = rows[:per_page]
+        has_previous = after is not None
+
+    return {
+        "items": items,
+        "per_page": per_page,
+        "next_cursor": items[-1].id if items and has_next else None,
+        "previous_cursor": items[0].id if items and has_previous else None,
     }
 
-    # Get user distribution by tier
-    for tier in AgeTier.query.all():
-        user_count = User.query.filter_by(tier_id=tier.id).count()
-        stats["tier_distribution"].append(
-            {
-                "name": tier.name,
-                "age_range": f"{tier.min_age}-{tier.max_age}",
-                "user_count": user_count,
-            }
-        )
 
-    return render_template("admin/dashboard.html", stats=stats)
+def _word_page(args):
+    """Keyset page of words matching the tier/category/part of speech/difficulty filters"""
+    filters = {}
+    query = VocabularyWord.query
+    for name, (column, cast) in WORD_FILTERS.items():
+        value = args.get(name, type=cast)
+        if value not in (None, ""):
+            filters[name] = value
+            query = query.filter(column == value)
+
+    page = _keyset_page(query, VocabularyWord.id, args)
+    page["filters"] = filters
+    return page
+
+
+def _word_dict(word):
+    return {
+        "id": word.id,
+        "word": word.word,
+        "definition": word.definition,
+        "part_of_speech": word.part_of_speech,
+        "category": word.category,
+        "difficulty_level": word.difficulty_level,
+        "tier_id": word.tier_id,
+    }
 
 
 @bp.route("/words")
 def manage_words():
-    words = VocabularyWord.query.all()
-    tiers = AgeTier.query.all()
-    return render_template("admin/words.html", words=words, tiers=tiers)
+    page = _word_page(request.args)
+    tiers = AgeTier.query.order_by(AgeTier.id).all()
+    return render_template("admin/words.html", page=page, words=page["items"], tiers=tiers)
+
+
+@bp.route("/api/words")
+def words_api():
+    page = _word_page(request.args)
+    return jsonify(
+        {
+            "words": [_word_dict(word) for word in page["items"]],
+            "filters": page["filters"],
+            "per_page": page["per_page"],
+            "next_cursor": page["next_cursor"],
+            "previous_cursor": page["previous_cursor"],
+        }
+    )
 
 
 @bp.route("/words/add", methods=["POST"])
@@ -58,7 +210,16 @@ def add_word():
         )
 
         db.session.add(new_word)
+        try:
+            db.session.flush()
+        except IntegrityError:
+            # uq_vocabulary_words_tier_word_key: same word (ignoring case) already in tier
+            db.session.rollback()
+            flash(f'"{word}" is already in this tier')
+            return redirect(url_for("admin.manage_words"))
+        refresh_tier_totals(tier_id)
         db.session.commit()
+        invalidate_vocabulary(tier_id)
         flash(f'Word "{word}" added successfully!')
     else:
         flash("Please fill in all required fields")
@@ -72,26 +233,103 @@ def manage_tiers():
     return render_template("admin/tiers.html", tiers=tiers)
 
 
+USER_EXPORT_COLUMNS = ("id", "username", "email", "age", "tier_id", "created_at", "last_active")
+
+
+def _user_search(query, search):
+    if search:
+        pattern = f"%{search}%"
+        query = query.filter(db.or_(User.username.ilike(pattern), User.email.ilike(pattern)))
+    return query
+
+
 @bp.route("/users")
+@admin_required
 def manage_users():
-    users = User.query.all()
-    return render_template("admin/users.html", users=users)
+    search = request.args.get("q", "").strip()
+    page = _keyset_page(_user_search(User.query, search), User.id, request.args)
+    return render_template("admin/users.html", page=page, users=page["items"], search=search)
+
+
+def _export_rows(search):
+    """Yield user rows from a server-side cursor instead of loading them all"""
+    columns = [getattr(User, name) for name in USER_EXPORT_COLUMNS]
+    statement = _user_search(db.select(*columns), search)
+    statement = statement.order_by(User.id).execution_options(
+        yield_per=current_app.config["EXPORT_BATCH_SIZE"]
+    )
+    for row in db.session.execute(statement):
+        yield [value.isoformat() if isinstance(value, datetime) else value for value in row]
+
+
+def _csv_lines(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(USER_EXPORT_COLUMNS)
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Flush the header when there are no rows
+    yield buffer.getvalue()
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(dict(zip(USER_EXPORT_COLUMNS, row))) + "\n"
+
+
+@bp.route("/users/export")
+@admin_required
+def export_users():
+    """Stream all matching users as CSV (default) or NDJSON (?format=ndjson)"""
+    rows = _export_rows(request.args.get("q", "").strip())
+    if request.args.get("format") == "ndjson":
+        lines, mimetype, extension = _ndjson_lines(rows), "application/x-ndjson", "ndjson"
+    else:
+        lines, mimetype, extension = _csv_lines(rows), "text/csv", "csv"
+
+    response = Response(stream_with_context(lines), mimetype=mimetype)
+    response.headers["Content-Disposition"] = f"attachment; filename=users.{extension}"
+    return response
+
+
+@bp.route("/pool-stats")
+@admin_required
+def pool_stats():
+    """Connection pool usage for each engine of this worker process"""
+    engines = app_engines(current_app)
+    return jsonify({"engines": {name: pool_status(engine) for name, engine in engines.items()}})
 
 
 @bp.route("/expand-vocabulary", methods=["POST"])
+@admin_required
 def expand_vocabulary():
-    """Expand vocabulary by 100x for all tiers"""
-    try:
-        # Run vocabulary expansion script
-        from expand_vocabulary import expand_vocabulary_by_tier
+    """Start expanding vocabulary by 100x for all tiers as a background job"""
+    from expand_vocabulary import expansion_job
+
+    job = find_active_job(EXPANSION_JOB)
+    if job is not None:
+        flash(f"Vocabulary expansion is already running (job #{job.id})")
+    else:
+        job = get_job_runner().submit(EXPANSION_JOB, expansion_job)
+        flash(f"Vocabulary expansion started (job #{job.id})")
+
+    return redirect(url_for("admin.dashboard", job=job.id))
 
-        expand_vocabulary_by_tier()
 
-        # Get updated stats
-        total_words = VocabularyWord.query.count()
-        flash(f"Vocabulary successfully expanded! Total words: {total_words}")
+@bp.route("/jobs/<int:job_id>")
+@admin_required
+def job_status(job_id):
+    job = db.get_or_404(BackgroundJob, job_id)
+    return jsonify(job_to_dict(job))
 
-    except Exception as e:
-        flash(f"Error expanding vocabulary: {str(e)}")
 
-    return redirect(url_for("admin.dashboard"))
+@bp.route("/jobs/<int:job_id>/cancel", methods=["POST"])
+@admin_required
+def cancel_job(job_id):
+    job = db.get_or_404(BackgroundJob, job_id)
+    if not request_cancel(job):
+        return jsonify({"error": f"Job already {job.status}", **job_to_dict(job)}), 409
+    return jsonify(job_to_dict(job))
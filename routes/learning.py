@@ -1,11 +1,28 @@
-from flask import Blueprint, render_template, session, redirect, url_for, request, jsonify
-from models import db, User, VocabularyWord, UserProgress
-from datetime import datetime
+from flask import (
+    Blueprint,
+    current_app,
+    render_template,
+    session,
+    redirect,
+    url_for,
+    request,
+    jsonify,
+)
+from models import db, User, VocabularyWord
+from utils.cache import get_tier_word_count
+from utils.progress import record_answer, record_answers
+from utils.routing import read_only
+from utils.scheduler import select_practice_words
+from utils.page_cache import USERNAME_PLACEHOLDER, render_guest_page
+from utils.snapshot import get_guest_words
+from utils.stats import get_user_stats
+from datetime import datetime, timezone
 
 bp = Blueprint("learning", __name__, url_prefix="/learning")
 
 
 @bp.route("/dashboard")
+@read_only
 def dashboard():
     if "user_id" not in session:
         return redirect(url_for("auth.login"))
@@ -13,7 +30,7 @@ def dashboard():
     # Handle demo and guest users
     if session.get("is_demo") or session.get("is_guest"):
         tier_id = session.get("tier_id", 3)  # Default to Elementary
-        total_words = VocabularyWord.query.filter_by(tier_id=tier_id).count()
+        total_words = get_tier_word_count(tier_id)
         learned_words = 8  # Mock progress for demo/guest
         progress_percentage = (learned_words / total_words * 100) if total_words > 0 else 0
 
@@ -34,11 +51,10 @@ def dashboard():
         if not user:
             return redirect(url_for("auth.login"))
 
-        # Get user's progress statistics
-        total_words = VocabularyWord.query.filter_by(tier_id=user.tier_id).count()
-        learned_words = UserProgress.query.filter(
-            UserProgress.user_id == user.id, UserProgress.mastery_level >= 80
-        ).count()
+        # Get user's progress statistics from the precomputed summary row
+        stats = get_user_stats(user)
+        total_words = stats.total_words
+        learned_words = stats.mastered_count
 
         progress_percentage = (learned_words / total_words * 100) if total_words > 0 else 0
 
@@ -51,23 +67,14 @@ def dashboard():
     )
 
 
-@bp.route("/vocabulary")
-def vocabulary():
-    if "user_id" not in session:
-        return redirect(url_for("auth.login"))
+def _guest_user(tier_id):
+    """Mock user object for demo and guest users; the username is filled in per request"""
+    return type("obj", (object,), {"username": USERNAME_PLACEHOLDER, "tier_id": tier_id})
 
-    # Handle demo and guest users
-    if session.get("is_demo") or session.get("is_guest"):
-        tier_id = session.get("tier_id", 3)  # Default to Elementary
-        tier_words_query = VocabularyWord.query.filter_by(tier_id=tier_id).limit(20).all()
-    else:
-        user = User.query.get(session["user_id"])
-        if not user:
-            return redirect(url_for("auth.login"))
-        tier_words_query = VocabularyWord.query.filter_by(tier_id=user.tier_id).limit(20).all()
 
+def _vocabulary_dicts(words):
     # Convert to dictionaries for JSON serialization in template
-    tier_words = [
+    return [
         {
             "id": word.id,
             "word": word.word,
@@ -76,22 +83,50 @@ def vocabulary():
             "category": word.category,
             "difficulty_level": word.difficulty_level,
         }
-        for word in tier_words_query
+        for word in words
+    ]
+
+
+def _practice_dicts(words):
+    return [
+        {
+            "id": word.id,
+            "word": word.word,
+            "definition": word.definition,
+            "difficulty_level": getattr(word, "difficulty_level", 1),
+        }
+        for word in words
     ]
 
-    # Create mock user object for demo and guest users
+
+def _guest_vocabulary_context(tier_id):
+    return {"words": _vocabulary_dicts(get_guest_words(tier_id, 20)), "user": _guest_user(tier_id)}
+
+
+def _guest_practice_context(tier_id):
+    # Just the first words of the tier, shared by all guests
+    return {"words": _practice_dicts(get_guest_words(tier_id, 10)), "user": _guest_user(tier_id)}
+
+
+@bp.route("/vocabulary")
+@read_only
+def vocabulary():
+    if "user_id" not in session:
+        return redirect(url_for("auth.login"))
+
+    # Demo and guest pages are identical per tier and served from the page cache
     if session.get("is_demo") or session.get("is_guest"):
-        mock_user = type(
-            "obj",
-            (object,),
-            {
-                "username": session.get("username", "Guest User"),
-                "tier_id": session.get("tier_id", 3),
-            },
-        )
-        user = mock_user
+        tier_id = session.get("tier_id", 3)  # Default to Elementary
+        return render_guest_page("learning/vocabulary.html", tier_id, _guest_vocabulary_context)
+
+    user = User.query.get(session["user_id"])
+    if not user:
+        return redirect(url_for("auth.login"))
+    tier_words = VocabularyWord.query.filter_by(tier_id=user.tier_id).limit(20).all()
 
-    return render_template("learning/vocabulary.html", words=tier_words, user=user)
+    return render_template(
+        "learning/vocabulary.html", words=_vocabulary_dicts(tier_words), user=user
+    )
 
 
 @bp.route("/practice")
@@ -99,54 +134,22 @@ def practice():
     if "user_id" not in session:
         return redirect(url_for("auth.login"))
 
-    # Handle demo and guest users
+    # Demo and guest pages are identical per tier and served from the page cache
     if session.get("is_demo") or session.get("is_guest"):
         tier_id = session.get("tier_id", 3)  # Default to Elementary
-        # For demo/guest users, just get vocabulary words for their tier
-        practice_words_query = VocabularyWord.query.filter_by(tier_id=tier_id).limit(10).all()
-    else:
-        user = User.query.get(session["user_id"])
-        if not user:
-            return redirect(url_for("auth.login"))
-
-        # Get words that need practice (low mastery or not practiced recently)
-        practice_words_query = (
-            db.session.query(VocabularyWord)
-            .outerjoin(
-                UserProgress,
-                (UserProgress.vocabulary_word_id == VocabularyWord.id)
-                & (UserProgress.user_id == user.id),
-            )
-            .filter(VocabularyWord.tier_id == user.tier_id)
-            .filter(db.or_(UserProgress.mastery_level < 70, UserProgress.mastery_level.is_(None)))
-            .limit(10)  # Simplified limit instead of using age_tier.words_per_session
-            .all()
-        )
+        return render_guest_page("learning/practice.html", tier_id, _guest_practice_context)
 
-    # Convert to dictionaries for JSON serialization
-    practice_words = [
-        {
-            "id": word.id,
-            "word": word.word,
-            "definition": word.definition,
-            "difficulty_level": getattr(word, "difficulty_level", 1),
-        }
-        for word in practice_words_query
-    ]
+    user = User.query.get(session["user_id"])
+    if not user:
+        return redirect(url_for("auth.login"))
 
-    # Create mock user object for demo and guest users
-    if session.get("is_demo") or session.get("is_guest"):
-        mock_user = type(
-            "obj",
-            (object,),
-            {
-                "username": session.get("username", "Guest User"),
-                "tier_id": session.get("tier_id", 3),
-            },
-        )
-        user = mock_user
+    # Due reviews first, then unseen words, sized to the tier's session length
+    session_size = current_app.config["WORDS_PER_SESSION"].get(user.tier_id, 10)
+    practice_words = select_practice_words(user.id, user.tier_id, session_size)
 
-    return render_template("learning/practice.html", words=practice_words, user=user)
+    return render_template(
+        "learning/practice.html", words=_practice_dicts(practice_words), user=user
+    )
 
 
 @bp.route("/practice/submit", methods=["POST"])
@@ -154,7 +157,7 @@ def submit_practice():
     if "user_id" not in session:
         return jsonify({"error": "Not authenticated"}), 401
 
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
     word_id = data.get("word_id")
     is_correct = data.get("is_correct", False)
 
@@ -172,49 +175,100 @@ def submit_practice():
             }
         )
 
-    # Find or create progress record for regular users
-    progress = UserProgress.query.filter_by(user_id=user_id, vocabulary_word_id=word_id).first()
-
-    if not progress:
-        progress = UserProgress(
-            user_id=user_id,
-            vocabulary_word_id=word_id,
-            attempts=0,
-            correct_answers=0,
-            mastery_level=0,
-        )
-        db.session.add(progress)
-
-    # Update progress
-    progress.attempts += 1
-    if is_correct:
-        progress.correct_answers += 1
-
-    # Calculate mastery level (simple algorithm)
-    if progress.attempts > 0:
-        accuracy = progress.correct_answers / progress.attempts
-        progress.mastery_level = min(100, int(accuracy * 100))
-
-    progress.last_practiced = datetime.utcnow()
+    try:
+        word_id = int(word_id)
+    except (TypeError, ValueError):
+        return jsonify({"error": "word_id is required"}), 400
 
+    # Single-statement upsert: counters are incremented by the database
+    progress = record_answer(user_id, word_id, is_correct)
     db.session.commit()
 
     return jsonify(
         {
             "success": True,
-            "mastery_level": progress.mastery_level,
-            "attempts": progress.attempts,
-            "correct_answers": progress.correct_answers,
+            "mastery_level": progress["mastery_level"],
+            "attempts": progress["attempts"],
+            "correct_answers": progress["correct_answers"],
         }
     )
 
 
+def _parse_answered_at(value):
+    """Parse a client ISO-8601 timestamp into naive UTC, clamped to now"""
+    now = datetime.utcnow()
+    if not value:
+        return now
+    answered_at = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if answered_at.tzinfo:
+        answered_at = answered_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return min(answered_at, now)
+
+
+def _parse_answers(payload):
+    """Validate a batch payload: a list of answers or {"answers": [...]}"""
+    records = payload.get("answers") if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not records:
+        raise ValueError("answers must be a non-empty list")
+    if len(records) > current_app.config["MAX_ANSWERS_PER_BATCH"]:
+        raise ValueError("too many answers in one batch")
+
+    answers = []
+    for record in records:
+        if not isinstance(record, dict):
+            raise ValueError("each answer must be an object")
+        try:
+            word_id = int(record.get("word_id"))
+        except (TypeError, ValueError):
+            raise ValueError("each answer needs a word_id")
+        answers.append(
+            {
+                "word_id": word_id,
+                "is_correct": bool(record.get("is_correct", False)),
+                "answered_at": _parse_answered_at(record.get("answered_at")),
+            }
+        )
+    return answers
+
+
+@bp.route("/practice/submit-batch", methods=["POST"])
+def submit_practice_batch():
+    """Apply a whole practice session's answers in one transaction"""
+    if "user_id" not in session:
+        return jsonify({"error": "Not authenticated"}), 401
+
+    try:
+        answers = _parse_answers(request.get_json(silent=True))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Handle demo and guest users (no persistent progress)
+    if session.get("is_demo") or session.get("is_guest"):
+        results = [
+            {
+                "word_id": answer["word_id"],
+                "mastery_level": 75 if answer["is_correct"] else 50,
+                "attempts": 3,
+                "correct_answers": 2,
+            }
+            for answer in answers
+        ]
+        return jsonify({"success": True, "results": results})
+
+    progress = record_answers(session["user_id"], answers)
+    db.session.commit()
+
+    results = [{"word_id": word_id, **counters} for word_id, counters in progress.items()]
+    return jsonify({"success": True, "results": results})
+
+
 @bp.route("/achievements")
 def achievements():
     if "user_id" not in session:
         return redirect(url_for("auth.login"))
 
     # Handle demo and guest users
+    stats = None
     if session.get("is_demo") or session.get("is_guest"):
         # Mock achievements data for demo/guest users
         total_mastered = 15
@@ -234,9 +288,8 @@ def achievements():
             return redirect(url_for("auth.login"))
 
         # Calculate achievements data
-        total_mastered = UserProgress.query.filter(
-            UserProgress.user_id == user.id, UserProgress.mastery_level >= 80
-        ).count()
+        stats = get_user_stats(user)
+        total_mastered = stats.mastered_count
         practice_streak = 1  # Placeholder - would need more complex logic
 
     # Mock achievements data structure that matches the template
@@ -282,7 +335,7 @@ def achievements():
     # Add user stats for template
     user.total_points = 0  # Placeholder
     user.words_learned = total_mastered
-    user.total_words = VocabularyWord.query.filter_by(tier_id=user.tier_id).count()
+    user.total_words = stats.total_words if stats else get_tier_word_count(user.tier_id)
     user.practice_sessions = 1  # Placeholder
     user.streak_days = practice_streak
 
@@ -6,9 +6,7 @@ from models import db, User, AgeTier, VocabularyWord
 @pytest.fixture
 def app():
     """Create application for testing."""
-    app = create_app()
-    app.config["TESTING"] = True
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:"})
 
     with app.app_context():
         db.create_all()
@@ -73,3 +71,955 @@ def test_age_tier_functionality(app):
         assert tier is not None
         assert tier.min_age == 5
         assert tier.max_age == 10
+
+
+def test_user_progress_indexes_created(app):
+    """Test the user_progress lookup indexes exist on a fresh database."""
+    from sqlalchemy import inspect
+
+    with app.app_context():
+        indexes = {ix["name"]: ix for ix in inspect(db.engine).get_indexes("user_progress")}
+        assert indexes["uq_user_progress_user_word"]["unique"]
+        assert "ix_user_progress_user_mastery" in indexes
+        assert "ix_user_progress_user_next_review" in indexes
+
+
+def test_schema_upgrade_adds_missing_indexes(app):
+    """Test schema upgrade restores indexes missing from an older database."""
+    from utils.schema import missing_indexes, upgrade_schema
+
+    with app.app_context():
+        db.session.execute(db.text("DROP INDEX ix_user_progress_user_mastery"))
+        db.session.commit()
+        assert [ix.name for ix in missing_indexes()] == ["ix_user_progress_user_mastery"]
+
+        report = upgrade_schema()
+        assert report["created"] == ["ix_user_progress_user_mastery"]
+        assert report["skipped"] == []
+        assert missing_indexes() == []
+
+
+def test_schema_upgrade_merges_duplicate_progress(app, client):
+    """Test upgrading merges duplicate progress rows so the answer upsert can run."""
+    from datetime import datetime
+    from models import UserProgress
+    from utils.schema import upgrade_schema
+
+    user_id = login_as(client, app)
+    with app.app_context():
+        db.session.execute(db.text("DROP INDEX uq_user_progress_user_word"))
+        for attempts, correct, day in [(3, 2, 1), (2, 2, 5)]:
+            db.session.add(
+                UserProgress(
+                    user_id=user_id,
+                    vocabulary_word_id=1,
+                    attempts=attempts,
+                    correct_answers=correct,
+                    last_practiced=datetime(2024, 1, day),
+                )
+            )
+        db.session.commit()
+
+        report = upgrade_schema()
+        assert report["created"] == ["uq_user_progress_user_word"]
+        assert report["backfilled"]["user_progress duplicates"] == 1
+        assert upgrade_schema()["backfilled"]["user_progress duplicates"] == 0
+        row = UserProgress.query.filter_by(user_id=user_id).one()
+        assert (row.attempts, row.correct_answers, row.mastery_level) == (5, 4, 80)
+        assert row.last_practiced == datetime(2024, 1, 5)
+
+    response = client.post("/learning/practice/submit", json={"word_id": 1, "is_correct": True})
+    assert response.get_json()["attempts"] == 6
+
+
+def test_schema_upgrade_merges_duplicate_words(app, client):
+    """Test upgrading a database with case duplicates merges them and their progress."""
+    from models import UserProgress
+    from utils.schema import missing_indexes, upgrade_schema
+    from utils.seeding import insert_vocabulary
+
+    user_id = login_as(client, app)
+    with app.app_context():
+        db.session.execute(db.text("DROP INDEX uq_vocabulary_words_tier_word_key"))
+        duplicate = VocabularyWord(word="Test ", word_key="test", definition="dup", tier_id=1)
+        db.session.add(duplicate)
+        db.session.flush()
+        for word_id in (1, duplicate.id):
+            db.session.add(
+                UserProgress(
+                    user_id=user_id, vocabulary_word_id=word_id, attempts=1, correct_answers=1
+                )
+            )
+        db.session.commit()
+
+        report = upgrade_schema()
+        assert report["created"] == ["uq_vocabulary_words_tier_word_key"]
+        assert report["backfilled"]["vocabulary_words duplicates"] == 1
+        assert missing_indexes() == []
+        assert [word.id for word in VocabularyWord.query.all()] == [1]
+        row = UserProgress.query.filter_by(user_id=user_id).one()
+        assert (row.vocabulary_word_id, row.attempts) == (1, 2)
+
+        assert insert_vocabulary([{"word": "TEST", "definition": "again", "tier_id": 1}]) == 0
+
+
+def login_as(client, app, username="learner"):
+    """Create a registered user and attach it to the test client session."""
+    with app.app_context():
+        user = User(username=username, age=8, tier_id=1)
+        db.session.add(user)
+        db.session.commit()
+        user_id = user.id
+
+    with client.session_transaction() as sess:
+        sess.pop("is_guest", None)
+        sess.pop("is_demo", None)
+        sess["user_id"] = user_id
+        sess["username"] = username
+        sess["tier_id"] = 1
+    return user_id
+
+
+def test_submit_practice_upserts_progress(app, client):
+    """Test repeated answers update a single progress row in place."""
+    from models import UserProgress
+
+    user_id = login_as(client, app)
+
+    first = client.post("/learning/practice/submit", json={"word_id": 1, "is_correct": True})
+    assert first.get_json() == {
+        "success": True,
+        "mastery_level": 100,
+        "attempts": 1,
+        "correct_answers": 1,
+    }
+
+    second = client.post("/learning/practice/submit", json={"word_id": 1, "is_correct": False})
+    assert second.get_json()["mastery_level"] == 50
+    assert second.get_json()["attempts"] == 2
+
+    with app.app_context():
+        rows = UserProgress.query.filter_by(user_id=user_id).all()
+        assert len(rows) == 1
+        assert rows[0].correct_answers == 1
+
+
+def test_submit_practice_requires_word_id(app, client):
+    """Test answers without a word are rejected."""
+    login_as(client, app)
+    response = client.post("/learning/practice/submit", json={"is_correct": True})
+    assert response.status_code == 400
+
+
+def test_submit_practice_batch(app, client):
+    """Test a batch of answers is folded per word and applied in one request."""
+    with app.app_context():
+        db.session.add(VocabularyWord(word="quiz", definition="A short test", tier_id=1))
+        db.session.commit()
+
+    login_as(client, app)
+    response = client.post(
+        "/learning/practice/submit-batch",
+        json={
+            "answers": [
+                {"word_id": 1, "is_correct": True, "answered_at": "2025-01-01T10:00:00Z"},
+                {"word_id": 2, "is_correct": False},
+                {"word_id": 1, "is_correct": False},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    results = {r["word_id"]: r for r in response.get_json()["results"]}
+    assert results[1] == {"word_id": 1, "mastery_level": 50, "attempts": 2, "correct_answers": 1}
+    assert results[2]["attempts"] == 1
+    assert results[2]["mastery_level"] == 0
+
+    again = client.post(
+        "/learning/practice/submit-batch", json=[{"word_id": 2, "is_correct": True}]
+    )
+    assert again.get_json()["results"][0]["mastery_level"] == 50
+
+
+def test_submit_practice_batch_validation(app, client):
+    """Test malformed or oversized batches are rejected."""
+    login_as(client, app)
+    assert client.post("/learning/practice/submit-batch", json={"answers": []}).status_code == 400
+    assert (
+        client.post("/learning/practice/submit-batch", json=[{"is_correct": True}]).status_code
+        == 400
+    )
+
+    app.config["MAX_ANSWERS_PER_BATCH"] = 2
+    too_many = [{"word_id": 1, "is_correct": True}] * 3
+    assert client.post("/learning/practice/submit-batch", json=too_many).status_code == 400
+
+
+def test_schedule_review_intervals():
+    """Test SM-2 intervals grow on correct answers and reset on a miss."""
+    from datetime import datetime, timedelta
+    from utils.scheduler import schedule_review, RELEARN_STEP
+
+    now = datetime(2025, 1, 1)
+    state = schedule_review({}, True, now)
+    assert state["interval_days"] == 1
+    assert state["next_review_date"] == now + timedelta(days=1)
+
+    state = schedule_review(state, True, now)
+    assert state["interval_days"] == 6
+    state = schedule_review(state, True, now)
+    assert state["interval_days"] == round(6 * state["ease_factor"])
+
+    lapsed = schedule_review(state, False, now)
+    assert lapsed["repetitions"] == 0
+    assert lapsed["next_review_date"] == now + RELEARN_STEP
+    assert lapsed["ease_factor"] < state["ease_factor"]
+
+
+def test_practice_selects_due_then_new_words(app, client):
+    """Test the practice session skips words scheduled for later review."""
+    from datetime import datetime, timedelta
+    from models import UserProgress
+    from utils.scheduler import select_practice_words
+
+    with app.app_context():
+        for word in ["alpha", "beta", "gamma"]:
+            db.session.add(VocabularyWord(word=word, definition=word, tier_id=1))
+        db.session.commit()
+
+    user_id = login_as(client, app)
+    client.post(
+        "/learning/practice/submit-batch",
+        json=[{"word_id": 1, "is_correct": True}, {"word_id": 2, "is_correct": False}],
+    )
+
+    with app.app_context():
+        progress = UserProgress.query.filter_by(user_id=user_id, vocabulary_word_id=1).one()
+        assert progress.repetitions == 1
+        assert progress.next_review_date > datetime.utcnow() + timedelta(hours=23)
+
+        later = datetime.utcnow() + timedelta(hours=1)
+        words = select_practice_words(user_id, 1, 10, now=later)
+        # Word 2 is due again after the relearning step, word 1 not until tomorrow
+        assert [word.id for word in words] == [2, 3, 4]
+        # After a tier change the old tier's due reviews do not take up the session
+        assert select_practice_words(user_id, 2, 10, now=later) == []
+
+    response = client.get("/learning/practice")
+    assert response.status_code == 200
+
+
+def test_user_stats_maintained_incrementally(app, client):
+    """Test answer submission keeps the summary row in line with a full rebuild."""
+    from models import UserStats
+    from utils.stats import rebuild_user_stats
+
+    with app.app_context():
+        db.session.add(VocabularyWord(word="quiz", definition="A short test", tier_id=1))
+        db.session.commit()
+
+    user_id = login_as(client, app)
+    client.post("/learning/practice/submit", json={"word_id": 1, "is_correct": True})
+    client.post(
+        "/learning/practice/submit-batch",
+        json=[{"word_id": 1, "is_correct": False}, {"word_id": 2, "is_correct": True}],
+    )
+
+    with app.app_context():
+        stats = db.session.get(UserStats, user_id)
+        incremental = (
+            stats.total_words,
+            stats.mastered_count,
+            stats.attempts,
+            stats.correct_answers,
+        )
+        # Word 1 dropped to 50% mastery, word 2 is at 100%
+        assert incremental == (2, 1, 3, 2)
+
+        rebuild_user_stats([user_id])
+        db.session.commit()
+        stats = db.session.get(UserStats, user_id, populate_existing=True)
+        assert (
+            stats.total_words,
+            stats.mastered_count,
+            stats.attempts,
+            stats.correct_answers,
+        ) == incremental
+
+    assert client.get("/learning/dashboard").status_code == 200
+    assert client.get("/learning/achievements").status_code == 200
+
+
+def test_tier_word_count_cache_invalidation(app, client):
+    """Test tier counts are cached until an admin vocabulary edit invalidates them."""
+    from utils.cache import get_tier_word_count, vocabulary_version
+
+    with app.app_context():
+        assert get_tier_word_count(1) == 1
+        version = vocabulary_version()
+
+        # Writes that bypass the admin paths are not seen until invalidation
+        db.session.add(VocabularyWord(word="stale", definition="Not fresh", tier_id=1))
+        db.session.commit()
+        assert get_tier_word_count(1) == 1
+
+    login_as(client, app)
+    client.post(
+        "/admin/words/add",
+        data={"word": "fresh", "definition": "Newly made", "tier_id": 1},
+    )
+
+    with app.app_context():
+        assert get_tier_word_count(1) == 3
+        assert vocabulary_version() == version + 1
+
+
+def test_admin_dashboard_stats(app, client):
+    """Test admin stats are aggregated per tier and served from the stats cache."""
+    from routes.admin import ADMIN_STATS_KEY
+    from utils.cache import get_cache
+
+    login_as(client, app)
+    response = client.get("/admin/")
+    assert response.status_code == 200
+    assert b"Computed at" in response.data
+
+    with app.app_context():
+        stats = get_cache().get(ADMIN_STATS_KEY)
+        assert stats["total_users"] == 1
+        assert stats["total_words"] == 1
+        assert stats["tier_distribution"] == [
+            {"name": "Test Tier", "age_range": "5-10", "user_count": 1}
+        ]
+
+        db.session.add(User(username="second", age=9, tier_id=1))
+        db.session.commit()
+
+    # Cached until the TTL expires or a refresh is requested
+    client.get("/admin/")
+    with app.app_context():
+        assert get_cache().get(ADMIN_STATS_KEY)["total_users"] == 1
+    client.get("/admin/?refresh=1")
+    with app.app_context():
+        assert get_cache().get(ADMIN_STATS_KEY)["tier_distribution"][0]["user_count"] == 2
+
+
+def test_admin_words_keyset_pagination(app, client):
+    """Test the word listing pages by id cursor and applies filters."""
+    with app.app_context():
+        for i in range(5):
+            category = "animals" if i % 2 else "colors"
+            db.session.add(
+                VocabularyWord(word=f"w{i}", definition="d", tier_id=1, category=category)
+            )
+        db.session.commit()
+
+    login_as(client, app)
+    first = client.get("/admin/api/words?per_page=2").get_json()
+    assert [w["id"] for w in first["words"]] == [1, 2]
+    assert first["previous_cursor"] is None
+
+    second = client.get(f"/admin/api/words?per_page=2&after={first['next_cursor']}").get_json()
+    assert [w["id"] for w in second["words"]] == [3, 4]
+
+    back = client.get(f"/admin/api/words?per_page=2&before={second['previous_cursor']}").get_json()
+    assert [w["id"] for w in back["words"]] == [1, 2]
+
+    animals = client.get("/admin/api/words?category=animals").get_json()
+    assert [w["word"] for w in animals["words"]] == ["w1", "w3"]
+    assert animals["next_cursor"] is None
+
+    page = client.get("/admin/words?per_page=2&tier_id=1")
+    assert page.status_code == 200
+    assert b"after=2" in page.data
+
+
+def test_admin_users_search_and_export(app, client):
+    """Test the user listing searches and the export streams every match."""
+    import json
+
+    with app.app_context():
+        for name in ["alice", "bob", "alfred"]:
+            db.session.add(User(username=name, email=f"{name}@example.com", age=30, tier_id=1))
+        db.session.commit()
+
+    client.get("/")  # anonymous visitors get a guest session
+    assert client.get("/admin/users/export").status_code == 403
+    login_as(client, app)
+    assert client.get("/admin/users").status_code == 403
+
+    app.config["ADMIN_USERNAMES"] = {"learner"}
+    page = client.get("/admin/users?q=al")
+    assert page.status_code == 200
+    assert b"alice" in page.data and b"alfred" in page.data
+    assert b"bob@example.com" not in page.data
+
+    csv_export = client.get("/admin/users/export?q=example.com")
+    assert csv_export.mimetype == "text/csv"
+    lines = csv_export.get_data(as_text=True).strip().splitlines()
+    assert lines[0] == "id,username,email,age,tier_id,created_at,last_active"
+    assert len(lines) == 4
+
+    ndjson_export = client.get("/admin/users/export?format=ndjson&q=bob")
+    records = [json.loads(line) for line in ndjson_export.get_data(as_text=True).splitlines()]
+    assert [record["username"] for record in records] == ["bob"]
+
+
+def test_expand_vocabulary_bulk_insert(app):
+    """Test expansion fills a tier to its target without duplicate words."""
+    from sqlalchemy import func
+    from expand_vocabulary import expand_vocabulary_by_tier
+
+    with app.app_context():
+        added = expand_vocabulary_by_tier(chunk_size=300)
+        assert added == {1: 999}
+
+        assert VocabularyWord.query.filter_by(tier_id=1).count() == 1000
+        distinct = db.session.execute(
+            db.select(func.count(func.distinct(func.lower(VocabularyWord.word))))
+        ).scalar()
+        assert distinct == 1000
+
+
+def test_expand_vocabulary_runs_as_background_job(app, client):
+    """Test the expansion endpoint returns immediately and reports job progress."""
+    from utils.jobs import get_job_runner
+
+    client.get("/")  # anonymous visitors get a guest session
+    assert client.post("/admin/expand-vocabulary").status_code == 403
+    assert client.get("/admin/jobs/1").status_code == 403
+    assert client.post("/admin/jobs/1/cancel").status_code == 403
+
+    login_as(client, app)
+    app.config["ADMIN_USERNAMES"] = {"learner"}
+    response = client.post("/admin/expand-vocabulary")
+    assert response.status_code == 302
+    job_id = int(response.headers["Location"].rsplit("job=", 1)[1])
+
+    with app.app_context():
+        get_job_runner().wait(job_id, timeout=30)
+
+    job = client.get(f"/admin/jobs/{job_id}").get_json()
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"added": {"1": 999}}
+    assert job["progress"]["tiers"] == {"1": {"added": 999, "target": 999}}
+    assert job["progress"]["added"] == job["progress"]["total"] == 999
+
+    assert client.post(f"/admin/jobs/{job_id}/cancel").status_code == 409
+    assert client.get("/admin/jobs/999").status_code == 404
+
+
+def test_background_job_cancellation(app, client):
+    """Test a cancel request stops a job the next time it reports progress."""
+    import threading
+    from utils.jobs import get_job_runner
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_job(job):
+        started.set()
+        release.wait(5)
+        job.report(step=1)
+        return "unreachable"
+
+    login_as(client, app)
+    app.config["ADMIN_USERNAMES"] = {"learner"}
+    with app.app_context():
+        job_id = get_job_runner().submit("test", slow_job).id
+    assert started.wait(5)
+
+    assert client.post(f"/admin/jobs/{job_id}/cancel").get_json()["cancel_requested"] is True
+    release.set()
+    with app.app_context():
+        get_job_runner().wait(job_id, timeout=5)
+
+    job = client.get(f"/admin/jobs/{job_id}").get_json()
+    assert job["status"] == "cancelled"
+    assert job["result"] is None
+
+
+def test_orphaned_jobs_expire_and_cancel(app, client):
+    """Test jobs left active by a dead worker expire or can be cancelled directly."""
+    from datetime import datetime, timedelta
+    from models import BackgroundJob
+    from utils.jobs import find_active_job
+
+    login_as(client, app)
+    app.config["ADMIN_USERNAMES"] = {"learner"}
+    with app.app_context():
+        stale = datetime.utcnow() - timedelta(seconds=app.config["JOB_HEARTBEAT_TIMEOUT"] + 1)
+        dead = BackgroundJob(kind="test", status="running", created_at=stale, updated_at=stale)
+        orphan = BackgroundJob(kind="other", status="running", created_at=datetime.utcnow())
+        db.session.add_all([dead, orphan])
+        db.session.commit()
+        dead_id, orphan_id = dead.id, orphan.id
+
+        assert find_active_job("test") is None
+        assert db.session.get(BackgroundJob, dead_id).status == "failed"
+        assert find_active_job("other").id == orphan_id
+
+    job = client.post(f"/admin/jobs/{orphan_id}/cancel").get_json()
+    assert job["status"] == "cancelled"
+    assert job["finished_at"] is not None
+
+
+def test_vocabulary_word_key_is_unique_per_tier(app, client):
+    """Test normalized word keys reject case/whitespace duplicates within a tier."""
+    from utils.seeding import insert_vocabulary
+    from utils.schema import backfill_word_keys
+
+    with app.app_context():
+        assert db.session.get(VocabularyWord, 1).word_key == "test"
+
+        inserted = insert_vocabulary(
+            [
+                {"word": " Test ", "definition": "dup", "tier_id": 1},
+                {"word": "Trial", "definition": "new", "tier_id": 1},
+            ]
+        )
+        db.session.commit()
+        assert inserted == 1
+
+        db.session.execute(VocabularyWord.__table__.update().values(word_key=None))
+        db.session.commit()
+        assert backfill_word_keys() == 2
+        keys = db.session.execute(db.select(VocabularyWord.word_key).order_by(VocabularyWord.id))
+        assert keys.scalars().all() == ["test", "trial"]
+
+    login_as(client, app)
+    client.post("/admin/words/add", data={"word": "TEST", "definition": "again", "tier_id": 1})
+    with app.app_context():
+        assert VocabularyWord.query.filter_by(tier_id=1).count() == 2
+
+
+def test_write_paths_without_upsert_support(app, client, monkeypatch):
+    """Test answers and seeding fall back to plain writes on SQLite without RETURNING."""
+    from models import UserProgress
+    from utils.database import upsert_insert
+    from utils.seeding import insert_vocabulary
+
+    user_id = login_as(client, app)
+    with app.app_context():
+        monkeypatch.setattr(db.engine.dialect, "insert_returning", False)
+        assert upsert_insert() is None
+        inserted = insert_vocabulary([{"word": "Trial", "definition": "new", "tier_id": 1}])
+        db.session.commit()
+        assert inserted == 1
+
+    for is_correct in (True, False):
+        response = client.post(
+            "/learning/practice/submit", json={"word_id": 1, "is_correct": is_correct}
+        )
+    assert response.get_json()["attempts"] == 2
+    with app.app_context():
+        assert UserProgress.query.filter_by(user_id=user_id).count() == 1
+
+
+def test_seed_vocabulary_from_jsonl(app, tmp_path):
+    """Test seed files are bulk inserted once, skipping words already present."""
+    import expanded_vocabulary
+    from utils.seeding import seed_vocabulary
+
+    seed_file = tmp_path / "seed.jsonl"
+    seed_file.write_text(
+        '{"tier_id": 1, "word": "Test", "definition": "dup"}\n'
+        '{"tier_id": 1, "word": "quiz", "definition": "A short test"}\n'
+        "\n"
+        '{"tier_id": 1, "word": "exam", "definition": "A formal test"}\n'
+    )
+
+    with app.app_context():
+        assert seed_vocabulary(str(seed_file), chunk_size=2) == {1: 2}
+        assert seed_vocabulary(str(seed_file)) == {1: 0}
+        assert VocabularyWord.query.filter_by(tier_id=1).count() == 3
+
+    words = expanded_vocabulary.expanded_vocabulary
+    assert len(words) > 500 and isinstance(words[0], VocabularyWord)
+
+
+def test_seed_database_applies_only_changes(app, monkeypatch, tmp_path):
+    """Test base seeding is skipped when unchanged and applies diffs when the seed changes."""
+    import utils.seeding as seeding
+
+    with app.app_context():
+        report = seeding.seed_database()
+        assert report["tiers"] == {"inserted": 5, "updated": 1}
+        assert report["words"] == {"inserted": 60, "updated": 0}
+        assert db.session.get(AgeTier, 1).name == "Early Verbal"
+        assert seeding.seed_database() is None
+
+        sample = tmp_path / "sample_vocabulary.jsonl"
+        lines = open(seeding.SAMPLE_VOCABULARY).read().splitlines()
+        lines[0] = lines[0].replace("Pet with fur", "A small furry pet")
+        lines.append('{"tier_id": 1, "word": "dog", "definition": "Pet that barks"}')
+        sample.write_text("\n".join(lines) + "\n")
+        monkeypatch.setattr(seeding, "SAMPLE_VOCABULARY", str(sample))
+
+        report = seeding.seed_database()
+        assert report["tiers"] == {"inserted": 0, "updated": 0}
+        assert report["words"] == {"inserted": 1, "updated": 1}
+        cat = VocabularyWord.query.filter_by(tier_id=1, word_key="cat").one()
+        assert cat.definition == "A small furry pet"
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """Test the SQLite tuning profile is applied to new connections."""
+    from sqlalchemy import text
+
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/t.db"})
+    with app.app_context():
+        names = ["journal_mode", "synchronous", "busy_timeout", "temp_store"]
+        values = [db.session.execute(text(f"PRAGMA {name}")).scalar() for name in names]
+        assert values == ["wal", 1, 5000, 2]  # synchronous NORMAL, temp_store MEMORY
+
+
+def test_pool_options_and_stats(app, tmp_path):
+    """Test pool settings apply to server databases and pool usage is reported."""
+    from utils.database import InstrumentedQueuePool, engine_options
+
+    config = dict(app.config, SQLALCHEMY_DATABASE_URI="postgresql://db/bolaquent")
+    options = engine_options(config)
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 5 and options["pool_pre_ping"] is True
+    assert "pool_size" not in engine_options(app.config)
+
+    file_app = create_app(
+        {"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/p.db"}
+    )
+    with file_app.app_context():
+        db.create_all()
+        User.query.count()
+    client = file_app.test_client()
+    client.get("/")  # anonymous visitors get a guest session
+    assert client.get("/admin/pool-stats").status_code == 403
+
+    login_as(client, file_app)
+    file_app.config["ADMIN_USERNAMES"] = {"learner"}
+    default = client.get("/admin/pool-stats").get_json()["engines"]["default"]
+    assert default["pool"] == "InstrumentedQueuePool"
+    assert default["checkouts"] >= 1 and default["timeouts"] == 0
+
+
+def test_read_only_views_use_replica_until_a_write(tmp_path):
+    """Test @read_only views read from the replica unless the user just wrote."""
+    import time
+    from utils.routing import LAST_WRITE_KEY, get_replica_engine
+
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/primary.db",
+            "SQLALCHEMY_REPLICA_URI": f"sqlite:///{tmp_path}/replica.db",
+        }
+    )
+    rows = [
+        (AgeTier, {"id": 1, "name": "Tier", "min_age": 5, "max_age": 10}),
+        (User, {"id": 1, "username": "reader", "age": 8, "tier_id": 1}),
+    ]
+    with app.app_context():
+        for engine, word in [(db.engine, "primaryword"), (get_replica_engine(), "replicaword")]:
+            db.metadata.create_all(engine)
+            with engine.begin() as connection:
+                for model, values in rows:
+                    connection.execute(model.__table__.insert(), values)
+                connection.execute(
+                    VocabularyWord.__table__.insert(),
+                    {"word": word, "word_key": word, "definition": "d", "tier_id": 1},
+                )
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+    assert b"replicaword" in client.get("/learning/vocabulary").data
+
+    with client.session_transaction() as sess:
+        sess[LAST_WRITE_KEY] = time.time()
+    assert b"primaryword" in client.get("/learning/vocabulary").data
+
+
+def test_read_only_view_rebuilds_stats_from_primary(tmp_path):
+    """Test a stats rebuild in a @read_only view reads the primary, not a lagging replica."""
+    from models import UserProgress, UserStats
+    from utils.routing import get_replica_engine
+
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path}/primary.db",
+            "SQLALCHEMY_REPLICA_URI": f"sqlite:///{tmp_path}/replica.db",
+        }
+    )
+    rows = [
+        (AgeTier, {"id": 1, "name": "Tier", "min_age": 5, "max_age": 10}),
+        (User, {"id": 1, "username": "reader", "age": 8, "tier_id": 1}),
+        (VocabularyWord, {"id": 1, "word": "w", "word_key": "w", "definition": "d", "tier_id": 1}),
+    ]
+    progress = {"user_id": 1, "vocabulary_word_id": 1, "attempts": 5, "correct_answers": 5}
+    with app.app_context():
+        for engine in (db.engine, get_replica_engine()):
+            db.metadata.create_all(engine)
+            with engine.begin() as connection:
+                for model, values in rows:
+                    connection.execute(model.__table__.insert(), values)
+        # The replica has not caught up with the user's answers yet
+        with db.engine.begin() as connection:
+            connection.execute(UserProgress.__table__.insert(), {**progress, "mastery_level": 100})
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess["user_id"] = 1
+    assert client.get("/learning/dashboard").status_code == 200
+
+    with app.app_context():
+        stats = db.session.get(UserStats, 1)
+        assert (stats.attempts, stats.mastered_count) == (5, 1)
+
+
+def test_guest_vocabulary_served_from_snapshot(app, client):
+    """Test guest pages read a shared snapshot that is rebuilt on vocabulary changes."""
+    from sqlalchemy import event
+    from utils.cache import invalidate_vocabulary
+    from utils.snapshot import get_guest_words
+
+    with client.session_transaction() as sess:
+        sess.update(user_id="guest", is_guest=True, tier_id=1, username="Guest")
+    assert b"A trial or examination" in client.get("/learning/vocabulary").data
+
+    with app.app_context():
+        statements = []
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args))
+        assert client.get("/learning/practice").status_code == 200
+        assert client.get("/learning/vocabulary").status_code == 200
+        assert statements == []
+
+        words = get_guest_words(1)
+        assert isinstance(words, tuple) and words[0].word == "test"
+
+        db.session.add(VocabularyWord(word="added", definition="New", tier_id=1))
+        db.session.commit()
+        invalidate_vocabulary(1)
+        assert [word.word for word in get_guest_words(1)] == ["test", "added"]
+
+
+def test_guest_pages_served_from_page_cache(app, client):
+    """Test guest pages are cached per tier and version with the username swapped in."""
+    from utils.cache import invalidate_vocabulary
+
+    with client.session_transaction() as sess:
+        sess.update(user_id="guest", is_guest=True, tier_id=1, username="Ada")
+    first = client.get("/learning/vocabulary")
+    assert first.headers["X-Page-Cache"] == "miss"
+    assert b"Ada" in first.data
+
+    with client.session_transaction() as sess:
+        sess["username"] = "<Bob>"
+    second = client.get("/learning/vocabulary")
+    assert second.headers["X-Page-Cache"] == "hit"
+    assert b"&lt;Bob&gt;" in second.data and b"Ada" not in second.data
+    assert client.get("/learning/practice").headers["X-Page-Cache"] == "miss"
+
+    with client.session_transaction() as sess:
+        sess["_flashes"] = [("message", "Welcome back")]
+    flashed = client.get("/learning/vocabulary")
+    assert flashed.headers["X-Page-Cache"] == "bypass" and b"Welcome back" in flashed.data
+
+    with app.app_context():
+        invalidate_vocabulary(1)
+    assert client.get("/learning/vocabulary").headers["X-Page-Cache"] == "miss"
+
+
+def test_static_assets_support_conditional_get(app, client):
+    """Test static routes send ETags from the manifest and answer revalidation with 304."""
+    from utils.assets import ASSETS_EXTENSION
+
+    response = client.get("/css/themes.css")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "public, max-age=31536000"
+    etag = response.headers["ETag"]
+    assert client.get("/static/css/themes.css").headers["ETag"] == etag
+
+    revalidated = client.get("/css/themes.css", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304 and revalidated.data == b""
+    last_modified = response.headers["Last-Modified"]
+    assert (
+        client.get(
+            "/static/css/themes.css", headers={"If-Modified-Since": last_modified}
+        ).status_code
+        == 304
+    )
+    assert (
+        client.get("/js/theme-manager.js", headers={"If-None-Match": '"stale"'}).status_code == 200
+    )
+    assert client.get("/css/missing.css").status_code == 404
+
+    # Files that were not in the startup manifest are read from disk on every route
+    del app.extensions[ASSETS_EXTENSION]["css/themes.css"]
+    from_disk = client.get("/css/themes.css")
+    assert from_disk.status_code == 200
+    assert from_disk.data == client.get("/static/css/themes.css").data == response.data
+
+
+def test_build_assets_bundles_and_precompresses(app, tmp_path):
+    """Test the asset build writes a minified, fingerprinted bundle served by encoding."""
+    import gzip
+    import shutil
+
+    from utils.assets import (
+        ASSET_BUNDLES,
+        ASSETS_EXTENSION,
+        BUNDLES_EXTENSION,
+        asset_urls,
+        build_assets,
+        build_manifest,
+        load_bundles,
+        minify_css,
+    )
+
+    assert minify_css("/* it's */ a > b ,c { color: red ; content: ' { x ; } ' ; }") == (
+        "a>b,c{color:red;content:' { x ; } '}"
+    )
+
+    shutil.copytree(app.static_folder, tmp_path, dirs_exist_ok=True)
+    built = build_assets(str(tmp_path))
+    bundle = tmp_path / built["app.css"]
+    assert bundle.name.startswith("app.") and bundle.name.endswith(".css")
+    sources = sum((tmp_path / path).stat().st_size for path in ASSET_BUNDLES["app.css"])
+    assert 0 < bundle.stat().st_size < sources
+
+    with app.test_request_context():
+        assert asset_urls("app.css")[0] == "/css/themes.css"
+        manifest = build_manifest(str(tmp_path))
+        app.extensions[ASSETS_EXTENSION] = manifest
+        app.extensions[BUNDLES_EXTENSION] = load_bundles(str(tmp_path), manifest)
+        # Linked through /css/, which nginx's /static/ alias cannot intercept
+        assert asset_urls("app.css") == ["/css/" + built["app.css"]]
+
+    client = app.test_client()
+    plain = client.get("/css/" + built["app.css"])
+    compressed = client.get("/css/" + built["app.css"], headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert gzip.decompress(compressed.data) == plain.data == bundle.read_bytes()
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+    assert client.get("/static/" + built["app.css"]).data == plain.data
+
+
+def test_critical_css_keeps_page_shell_rules(app, tmp_path):
+    """Test critical CSS keeps shell and default theme rules and is inlined once built."""
+    import shutil
+
+    from utils.assets import ASSETS_EXTENSION, BUNDLES_EXTENSION, build_assets, build_manifest
+    from utils.assets import extract_critical_css, load_bundles
+
+    css = (
+        ':root{--a:1}[data-theme="dark"]{--b:2}[data-theme="dracula"]{--b:3}'
+        ".nav a{color:red}.card{color:blue}@keyframes spin{to{opacity:0}}"
+        "@media (max-width:768px){.nav-menu{display:none}.card{margin:0}}"
+    )
+    assert extract_critical_css(css) == (
+        ':root{--a:1}[data-theme="dark"]{--b:2}.nav a{color:red}'
+        "@media (max-width:768px){.nav-menu{display:none}}"
+    )
+
+    shutil.copytree(app.static_folder, tmp_path, dirs_exist_ok=True)
+    build_assets(str(tmp_path))
+    manifest = build_manifest(str(tmp_path))
+    app.extensions[ASSETS_EXTENSION] = manifest
+    app.extensions[BUNDLES_EXTENSION] = load_bundles(str(tmp_path), manifest)
+
+    page = app.test_client().get("/auth/login").text
+    assert "<style>:root{" in page
+    assert 'rel="preload"' in page and "/css/themes.css" not in page
+
+
+def test_compression_middleware(app, client):
+    """Test large text responses are gzipped, small or opted-out ones are not."""
+    import gzip
+
+    from utils.compression import no_compression
+
+    app.add_url_rule("/raw", "raw", no_compression(lambda: "x" * 2000))
+    with client.session_transaction() as sess:
+        sess.update(user_id="guest", is_guest=True, tier_id=1)
+
+    plain = client.get("/learning/vocabulary")
+    assert "Content-Encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["Vary"]
+    compressed = client.get("/learning/vocabulary", headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in compressed.headers
+    assert gzip.decompress(compressed.data) == plain.data
+    assert len(compressed.data) < len(plain.data) / 2
+
+    small = client.post(
+        "/learning/practice/submit", json={"word_id": 1}, headers={"Accept-Encoding": "gzip"}
+    )
+    assert small.status_code == 200
+    assert "Content-Encoding" not in small.headers
+    raw = client.get("/raw", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in raw.headers and raw.data == b"x" * 2000
+
+    login_as(client, app)
+    app.config["ADMIN_USERNAMES"] = {"learner"}
+    export = client.get("/admin/users/export", headers={"Accept-Encoding": "gzip"})
+    assert export.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(export.data).startswith(b"id,username,email")
+
+
+def test_compression_of_streamed_bodies():
+    """Test streamed rows are flushed in blocks and the body closes even if never iterated."""
+    import gzip
+
+    from utils.compression import CompressionMiddleware
+
+    rows = [f"{i},user{i},user{i}@example.com\n".encode() for i in range(5000)]
+    closed = []
+
+    class Body(list):
+        def close(self):
+            closed.append(True)
+
+    def wsgi_app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/csv")])
+        return Body(rows)
+
+    middleware = CompressionMiddleware(wsgi_app, mimetypes=["text/csv"])
+    environ = {"REQUEST_METHOD": "GET", "HTTP_ACCEPT_ENCODING": "gzip"}
+    data = b"".join(middleware(environ, lambda status, headers, exc_info=None: None))
+    assert gzip.decompress(data) == b"".join(rows)
+    assert len(data) < len(gzip.compress(b"".join(rows), 6)) * 1.1
+
+    middleware(environ, lambda status, headers, exc_info=None: None).close()
+    assert closed == [True]
+
+
+def test_templates_precompiled_into_bytecode_cache(tmp_path):
+    """Test TEMPLATE_PRECOMPILE compiles every template into the bytecode cache at startup."""
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "TEMPLATE_CACHE_DIR": str(tmp_path),
+            "TEMPLATE_PRECOMPILE": True,
+        }
+    )
+    templates = [name for name in app.jinja_env.list_templates() if name.endswith(".html")]
+    assert "learning/practice.html" in templates
+    assert len(list(tmp_path.iterdir())) == len(templates)
+
+
+def test_init_db_upgrades_existing_database(tmp_path):
+    """Test /init-db adds columns declared after an existing database was created."""
+    import shutil
+    from pathlib import Path
+
+    database = tmp_path / "old.db"
+    shutil.copy(Path(__file__).parent / "bolaquent.db", database)
+    app = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": f"sqlite:///{database}"})
+    client = app.test_client()
+
+    assert client.get("/init-db").status_code == 302
+    client.get("/")  # guest session
+    assert client.get("/learning/dashboard").status_code == 200
+    with app.app_context():
+        assert all(word.word_key for word in VocabularyWord.query.limit(10))
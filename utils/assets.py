@@ -0,0 +1,314 @@
+"""
+Static assets for Bolaquent
+
+The files under the static folder are read once at startup into an in-memory
+manifest holding their bytes, a content-hash ETag and their modification time.
+The /css/, /js/ and /static/ routes answer from it, so a full response needs no
+disk read and a revalidation (If-None-Match / If-Modified-Since) gets a bodiless
+304. Files added after startup are not in the manifest and are served from disk.
+Stylesheets and scripts are linked through /css/ and /js/ rather than /static/,
+which nginx may intercept on AWS (see AWS_STATIC_FILE_SOLUTION.md).
+
+`flask build-assets` concatenates and minifies the ASSET_BUNDLES into
+fingerprinted files under static/dist, with .gz (and, when the brotli package is
+installed, .br) siblings and a manifest.json. Templates link bundles through
+asset_urls(), which returns the built file when there is one and the source files
+otherwise. Built files are reached as /css/dist/... and /js/dist/...;
+precompressed siblings are served to clients that accept them.
+
+The build also writes the above-the-fold subset of each CRITICAL_BUNDLES
+stylesheet (rules for the page shell, navigation and theme variables, picked by
+the CRITICAL_*_PREFIXES). base.html inlines it with critical_css() and loads
+the full bundle without blocking rendering.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import click
+from flask import Response, current_app, request, send_from_directory, url_for
+from flask.cli import with_appcontext
+from markupsafe import Markup
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are built without it
+    brotli = None
+
+ASSETS_EXTENSION = "bolaquent_assets"
+BUNDLES_EXTENSION = "bolaquent_asset_bundles"
+
+# Bundle name -> source files (relative to the static folder), in cascade order
+ASSET_BUNDLES = {
+    "app.css": [
+        "css/themes.css",
+        "css/additional-themes.css",
+        "css/dashboard.css",
+        "css/hero-backgrounds.css",
+        "css/layout.css",
+    ],
+    # Linked at the end of base.html's body, after the page templates' own <style> blocks
+    "overrides.css": ["css/overrides.css"],
+    "theme-manager.js": ["js/theme-manager.js"],
+}
+CRITICAL_BUNDLES = ("app.css",)
+
+# A rule is critical when a compound of one of its selectors starts with a shell prefix,
+# or the selector's subject starts with a root prefix (theme variables, html and body)
+CRITICAL_SHELL_PREFIXES = (".container", ".nav", ".hamburger", ".theme-selector")
+CRITICAL_ROOT_PREFIXES = (":root", "html", "body", "[data-theme", ".theme-", "*")
+# Pages render with data-theme="dark"; other themes are applied by script after loading
+_OTHER_THEME = re.compile(r'\[data-theme="(?!dark")')
+
+BUILD_DIR = "dist"
+BUILD_MANIFEST = "manifest.json"
+
+# Extension -> (endpoint, static directory) of the routes that bypass nginx's /static/
+ASSET_ROUTES = {".css": ("serve_css", "css"), ".js": ("serve_js", "js")}
+
+# Precompressed sibling suffixes, in order of preference
+ENCODING_SUFFIXES = {".br": "br", ".gz": "gzip"}
+
+StaticAsset = namedtuple("StaticAsset", "path data etag last_modified mimetype encodings")
+
+_CSS_STRING = r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')"""
+_CSS_COMMENT_OR_STRING = re.compile(r"/\*.*?\*/|" + _CSS_STRING, re.S)
+_CSS_SPACE_AROUND = re.compile(r"\s*([{};,>])\s*")
+_CSS_BRACE_OR_STRING = re.compile(r"[{}]|" + _CSS_STRING)
+
+
+def _read(root, path):
+    with open(os.path.join(root, *path.split("/")), "rb") as f:
+        return f.read()
+
+
+def load_asset(root, path, encodings=None):
+    """Read one static file into a StaticAsset; path is relative to root, with / separators"""
+    data = _read(root, path)
+    mtime = os.path.getmtime(os.path.join(root, *path.split("/")))
+    modified = datetime.fromtimestamp(int(mtime), timezone.utc)
+    mimetype = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    etag = hashlib.sha256(data).hexdigest()[:32]
+    return StaticAsset(path, data, etag, modified, mimetype, encodings or {})
+
+
+def build_manifest(root):
+    """Map every file under root (relative path -> StaticAsset), with compressed siblings"""
+    if not root or not os.path.isdir(root):
+        return {}
+    paths = set()
+    for directory, _, files in os.walk(root):
+        for name in files:
+            paths.add(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, "/"))
+
+    manifest = {}
+    for path in paths:
+        base, suffix = os.path.splitext(path)
+        if suffix in ENCODING_SUFFIXES and base in paths:
+            continue
+        encodings = {
+            encoding: _read(root, path + suffix)
+            for suffix, encoding in ENCODING_SUFFIXES.items()
+            if path + suffix in paths
+        }
+        manifest[path] = load_asset(root, path, encodings)
+    return manifest
+
+
+def load_bundles(root, manifest):
+    """Read the build manifest, keeping only bundles whose built file is present"""
+    try:
+        with open(os.path.join(root, BUILD_DIR, BUILD_MANIFEST)) as f:
+            bundles = json.load(f)
+    except (OSError, TypeError, ValueError):
+        return {}
+    return {name: path for name, path in bundles.items() if path in manifest}
+
+
+def init_assets(app):
+    manifest = build_manifest(app.static_folder)
+    app.extensions[ASSETS_EXTENSION] = manifest
+    app.extensions[BUNDLES_EXTENSION] = load_bundles(app.static_folder, manifest)
+    app.add_template_global(asset_urls)
+    app.add_template_global(critical_css)
+    return manifest
+
+
+def get_asset(path):
+    return current_app.extensions[ASSETS_EXTENSION].get(path)
+
+
+def asset_path(directory, filename):
+    """Static path for a /css/ or /js/ URL: dist/ names a build, anything else a source"""
+    if filename.startswith(f"{BUILD_DIR}/"):
+        return filename
+    return f"{directory}/{filename}"
+
+
+def asset_url(path):
+    """URL for a static file, through /css/ or /js/ when one serves its type"""
+    route = ASSET_ROUTES.get(os.path.splitext(path)[1])
+    if route is None:
+        return url_for("static", filename=path)
+    endpoint, directory = route
+    if path.startswith(f"{directory}/"):
+        path = path.split("/", 1)[1]
+    return url_for(endpoint, filename=path)
+
+
+def asset_urls(name):
+    """URLs to link for a bundle: its fingerprinted build, or its source files if unbuilt"""
+    built = current_app.extensions[BUNDLES_EXTENSION].get(name)
+    paths = [built] if built else ASSET_BUNDLES.get(name, [name])
+    return [asset_url(path) for path in paths]
+
+
+def critical_css(name):
+    """Above-the-fold rules of a built bundle, for inlining; empty when there is no build"""
+    stem, ext = os.path.splitext(name)
+    path = current_app.extensions[BUNDLES_EXTENSION].get(f"{stem}.critical{ext}")
+    return Markup(get_asset(path).data.decode("utf-8")) if path else ""
+
+
+def _negotiate(asset):
+    for encoding in ENCODING_SUFFIXES.values():
+        if encoding in asset.encodings and request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+
+def send_asset(path):
+    """Serve a static file from the manifest, honouring conditional request headers"""
+    max_age = current_app.config["STATIC_MAX_AGE"]
+    asset = get_asset(path)
+    if asset is None:
+        # Not known at startup: let Flask read it (and raise NotFound if it is missing)
+        return send_from_directory(current_app.static_folder, path, max_age=max_age)
+
+    encoding = _negotiate(asset)
+    if encoding:
+        response = Response(asset.encodings[encoding], mimetype=asset.mimetype)
+        response.content_encoding = encoding
+        response.set_etag(f"{asset.etag}-{encoding}")
+    else:
+        response = Response(asset.data, mimetype=asset.mimetype)
+        response.set_etag(asset.etag)
+    if asset.encodings:
+        response.vary.add("Accept-Encoding")
+    response.last_modified = asset.last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    # Turns the response into a 304 without a body when the client's copy is current
+    return response.make_conditional(request)
+
+
+def minify_css(css):
+    """Drop comments and insignificant whitespace, leaving quoted strings untouched"""
+    css = _CSS_COMMENT_OR_STRING.sub(lambda match: match.group(1) or "", css)
+    parts = re.split(_CSS_STRING, css)
+    # Even indexes are the text between strings
+    for i in range(0, len(parts), 2):
+        part = _CSS_SPACE_AROUND.sub(r"\1", re.sub(r"\s+", " ", parts[i]))
+        parts[i] = re.sub(r":\s+", ":", part).replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def _css_blocks(css):
+    """Split minified CSS into its top-level (prelude, body) pairs"""
+    blocks, depth, start, prelude = [], 0, 0, ""
+    for match in _CSS_BRACE_OR_STRING.finditer(css):
+        end = match.start()
+        if match.group() == "{":
+            if depth == 0:
+                prelude, start = css[start:end], match.end()
+            depth += 1
+        elif match.group() == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:end]))
+                start = match.end()
+    return blocks
+
+
+def _is_critical(selector):
+    if _OTHER_THEME.search(selector):
+        return False
+    compounds = [c for c in re.split(r"[\s>+~]+", selector.strip()) if c]
+    if any(c.startswith(CRITICAL_SHELL_PREFIXES) for c in compounds):
+        return True
+    return bool(compounds) and compounds[-1].startswith(CRITICAL_ROOT_PREFIXES)
+
+
+def extract_critical_css(css):
+    """Keep the rules of minified CSS that style the page shell, including inside @media"""
+    rules = []
+    for prelude, body in _css_blocks(css):
+        if prelude.startswith(("@media", "@supports")):
+            inner = extract_critical_css(body)
+            if inner:
+                rules.append(f"{prelude}{{{inner}}}")
+        elif not prelude.startswith("@") and any(map(_is_critical, prelude.split(","))):
+            rules.append(f"{prelude}{{{body}}}")
+    return "".join(rules)
+
+
+def _write_build(out_dir, filename, data):
+    variants = {filename: data, filename + ".gz": gzip.compress(data, 9, mtime=0)}
+    if brotli is not None:
+        variants[filename + ".br"] = brotli.compress(data)
+    for variant, content in variants.items():
+        with open(os.path.join(out_dir, variant), "wb") as f:
+            f.write(content)
+
+
+def build_assets(root, bundles=ASSET_BUNDLES):
+    """Write fingerprinted, precompressed bundles to root/dist; returns the build manifest"""
+    out_dir = os.path.join(root, BUILD_DIR)
+    # Old fingerprints are not kept: a deploy serves only the files its templates link
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir)
+
+    built = {}
+    for name, sources in bundles.items():
+        text = "\n".join(_read(root, source).decode("utf-8") for source in sources)
+        if name.endswith(".css"):
+            text = minify_css(text)
+        data = text.encode("utf-8")
+        stem, ext = os.path.splitext(name)
+        filename = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}"
+        _write_build(out_dir, filename, data)
+        built[name] = f"{BUILD_DIR}/{filename}"
+
+        if name in CRITICAL_BUNDLES:
+            # Inlined into pages rather than linked, so it needs no fingerprint
+            _write_build(out_dir, f"{stem}.critical{ext}", extract_critical_css(text).encode())
+            built[f"{stem}.critical{ext}"] = f"{BUILD_DIR}/{stem}.critical{ext}"
+
+    with open(os.path.join(out_dir, BUILD_MANIFEST), "w") as f:
+        json.dump(built, f, indent=2, sort_keys=True)
+    return built
+
+
+@click.command("build-assets")
+@with_appcontext
+def build_assets_command():
+    """Bundle, minify, fingerprint and precompress the static assets."""
+    root = current_app.static_folder
+    for name, path in build_assets(root).items():
+        sources = ASSET_BUNDLES.get(name, [])
+        source_size = sum(os.path.getsize(os.path.join(root, s)) for s in sources)
+        size = os.path.getsize(os.path.join(root, path))
+        gzipped = os.path.getsize(os.path.join(root, path + ".gz"))
+        if sources:
+            click.echo(f"{name} -> {path} ({source_size} -> {size} bytes, {gzipped} gzipped)")
+        else:
+            click.echo(f"{name} -> {path} ({size} bytes inlined, {gzipped} gzipped)")
+    if brotli is None:
+        click.echo("brotli is not installed; only gzip variants were written")
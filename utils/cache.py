@@ -0,0 +1,136 @@
+"""
+Application caches for Bolaquent
+
+Vocabulary only changes through the admin word form and the expansion script, so
+per-tier word counts are cached and explicitly invalidated by those writers. Each
+invalidation also bumps a vocabulary version that other caches key on.
+
+The default backend is in-process; entries expire after CACHE_DEFAULT_TTL so other
+worker processes converge after an admin edit. Setting CACHE_REDIS_URL (with the
+redis package installed) shares entries and invalidations across workers.
+"""
+
+import json
+import threading
+import time
+
+from flask import current_app
+
+from models import VocabularyWord
+
+try:
+    import redis
+except ImportError:  # optional shared backend
+    redis = None
+
+VOCABULARY_VERSION_KEY = "vocabulary_version"
+
+
+class MemoryCache:
+    """Thread-safe dict cache with per-entry expiry"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+    def incr(self, key):
+        with self._lock:
+            value = (self._entries.get(key, (0, None))[0] or 0) + 1
+            self._entries[key] = (value, None)
+            return value
+
+
+class RedisCache:
+    """Shared cache backed by Redis; values are stored as JSON"""
+
+    def __init__(self, url, prefix="bolaquent:"):
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key):
+        value = self._client.get(self._prefix + key)
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl=None):
+        self._client.set(self._prefix + key, json.dumps(value), ex=ttl)
+
+    def delete(self, *keys):
+        if keys:
+            self._client.delete(*[self._prefix + key for key in keys])
+
+    def delete_prefix(self, prefix):
+        keys = list(self._client.scan_iter(match=f"{self._prefix}{prefix}*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def incr(self, key):
+        return self._client.incr(self._prefix + key)
+
+
+def init_cache(app):
+    """Attach the configured cache backend to the app"""
+    url = app.config.get("CACHE_REDIS_URL")
+    if url and redis is None:
+        app.logger.warning("CACHE_REDIS_URL is set but redis is not installed; using memory cache")
+    backend = RedisCache(url) if url and redis is not None else MemoryCache()
+    app.extensions["bolaquent_cache"] = backend
+    return backend
+
+
+def get_cache():
+    return current_app.extensions["bolaquent_cache"]
+
+
+def vocabulary_version():
+    """Counter bumped whenever vocabulary changes; use it in derived cache keys"""
+    return get_cache().get(VOCABULARY_VERSION_KEY) or 0
+
+
+def get_tier_word_count(tier_id):
+    """Number of vocabulary words in a tier, served from cache when possible"""
+    cache = get_cache()
+    key = f"tier_word_count:{tier_id}"
+    count = cache.get(key)
+    if count is None:
+        count = VocabularyWord.query.filter_by(tier_id=tier_id).count()
+        cache.set(key, count, current_app.config["CACHE_DEFAULT_TTL"])
+    return count
+
+
+def invalidate_vocabulary(tier_id=None):
+    """Drop cached counts for one tier (or all) and bump the vocabulary version
+
+    Call after the vocabulary change has been committed.
+    """
+    cache = get_cache()
+    if tier_id is None:
+        cache.delete_prefix("tier_word_count:")
+    else:
+        cache.delete(f"tier_word_count:{tier_id}")
+    cache.incr(VOCABULARY_VERSION_KEY)
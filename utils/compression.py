@@ -0,0 +1,211 @@
+"""
+Response compression for Bolaquent
+
+CompressionMiddleware wraps app.wsgi_app and gzip- (or, when the brotli package
+is installed, brotli-) encodes text responses for clients that accept it: the
+HTML pages, JSON and CSV/NDJSON exports. Responses with a known Content-Length
+below COMPRESS_MIN_SIZE, already-encoded responses (precompressed static assets),
+non-200 statuses and HEAD requests pass through untouched. Streamed responses
+without a length are compressed as they go and flushed every FLUSH_THRESHOLD bytes
+of input, so exports still arrive incrementally without a flush per row costing
+compression. Views decorated with @no_compression opt out.
+
+`flask compression-report` renders the learning pages for a guest and prints the
+bytes saved per encoding.
+"""
+
+import zlib
+from functools import wraps
+
+import click
+from flask import current_app, request
+from flask.cli import with_appcontext
+from werkzeug.datastructures import Headers
+from werkzeug.http import parse_accept_header
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only without it
+    brotli = None
+
+SKIP_ENVIRON_KEY = "bolaquent.skip_compression"
+
+# Uncompressed bytes buffered by an encoder before it flushes output to the client
+FLUSH_THRESHOLD = 8192
+
+REPORT_PAGES = (
+    "/learning/dashboard",
+    "/learning/vocabulary",
+    "/learning/practice",
+    "/learning/achievements",
+)
+
+
+def no_compression(view):
+    """Send this view's responses uncompressed"""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        request.environ[SKIP_ENVIRON_KEY] = True
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+class _GzipStream:
+    def __init__(self, level):
+        # wbits 16 + MAX_WBITS writes the gzip header and trailer
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._pending = 0
+
+    def compress(self, chunk):
+        data = self._compressor.compress(chunk)
+        self._pending += len(chunk)
+        if self._pending < FLUSH_THRESHOLD:
+            return data
+        self._pending = 0
+        return data + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=min(level, 11))
+        self._pending = 0
+
+    def compress(self, chunk):
+        data = self._compressor.process(chunk)
+        self._pending += len(chunk)
+        if self._pending < FLUSH_THRESHOLD:
+            return data
+        self._pending = 0
+        return data + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+
+ENCODERS = {"gzip": _GzipStream}
+if brotli is not None:
+    ENCODERS = {"br": _BrotliStream, **ENCODERS}
+
+
+class CompressionMiddleware:
+    """WSGI middleware that compresses eligible responses"""
+
+    def __init__(self, app, min_size=500, level=6, mimetypes=()):
+        self.app = app
+        self.min_size = min_size
+        self.level = level
+        self.mimetypes = frozenset(mimetypes)
+
+    def __call__(self, environ, start_response):
+        encoding = self._negotiate(environ)
+        chosen = []
+
+        def compressing_start_response(status, headers, exc_info=None):
+            headers = Headers(headers)
+            if self._compressible(headers):
+                # The body depends on Accept-Encoding even when this client gets identity
+                vary = [v.strip() for v in headers.get("Vary", "").split(",") if v.strip()]
+                if "accept-encoding" not in (v.lower() for v in vary):
+                    headers["Vary"] = ", ".join(vary + ["Accept-Encoding"])
+                if encoding and self._should_compress(environ, status, headers):
+                    chosen.append(encoding)
+                    del headers["Content-Length"]
+                    headers["Content-Encoding"] = encoding
+                    etag = headers.get("ETag")
+                    if etag and not etag.startswith("W/"):
+                        headers["ETag"] = "W/" + etag
+            return start_response(status, headers.to_wsgi_list(), exc_info)
+
+        app_iter = self.app(environ, compressing_start_response)
+        if not chosen:
+            return app_iter
+        return _CompressedIterable(app_iter, ENCODERS[encoding](self.level))
+
+    def _negotiate(self, environ):
+        if environ.get("REQUEST_METHOD") == "HEAD":
+            return None
+        accepted = parse_accept_header(environ.get("HTTP_ACCEPT_ENCODING"))
+        for encoding in ENCODERS:
+            if accepted[encoding]:
+                return encoding
+        return None
+
+    def _compressible(self, headers):
+        if "Content-Encoding" in headers:
+            return False
+        mimetype = headers.get("Content-Type", "").split(";")[0].strip().lower()
+        return mimetype in self.mimetypes
+
+    def _should_compress(self, environ, status, headers):
+        if environ.get(SKIP_ENVIRON_KEY) or not status.startswith("200"):
+            return False
+        length = headers.get("Content-Length")
+        # Streamed responses have no length and are always compressed
+        return length is None or int(length) >= self.min_size
+
+
+class _CompressedIterable:
+    """Compressed body of a response; closes the wrapped app_iter even if never iterated"""
+
+    def __init__(self, app_iter, stream):
+        self.app_iter = app_iter
+        self.stream = stream
+
+    def __iter__(self):
+        for chunk in self.app_iter:
+            if chunk:
+                data = self.stream.compress(chunk)
+                if data:
+                    yield data
+        yield self.stream.finish()
+
+    def close(self):
+        if hasattr(self.app_iter, "close"):
+            self.app_iter.close()
+
+
+def init_compression(app):
+    if not app.config["COMPRESS_RESPONSES"]:
+        return None
+    app.wsgi_app = CompressionMiddleware(
+        app.wsgi_app,
+        min_size=app.config["COMPRESS_MIN_SIZE"],
+        level=app.config["COMPRESS_LEVEL"],
+        mimetypes=app.config["COMPRESS_MIMETYPES"],
+    )
+    return app.wsgi_app
+
+
+@click.command("compression-report")
+@click.option("--tier", default=3, help="Age tier of the guest session.")
+@with_appcontext
+def compression_report_command(tier):
+    """Print the compressed size of the learning pages for a guest."""
+    client = current_app.test_client()
+    with client.session_transaction() as session:
+        session.update(user_id="guest", username="Guest User", tier_id=tier, is_guest=True)
+
+    encodings = list(ENCODERS)
+    click.echo(f"{'page':<26}{'identity':>10}" + "".join(f"{e:>16}" for e in encodings))
+    totals = [0] * (len(encodings) + 1)
+    for path in REPORT_PAGES:
+        sizes = [len(client.get(path, headers={"Accept-Encoding": "identity"}).data)]
+        for encoding in encodings:
+            response = client.get(path, headers={"Accept-Encoding": encoding})
+            sizes.append(len(response.data))
+        totals = [total + size for total, size in zip(totals, sizes)]
+        click.echo(_report_row(path, sizes))
+    click.echo(_report_row("total", totals))
+    if brotli is None:
+        click.echo("brotli is not installed; only gzip was measured")
+
+
+def _report_row(label, sizes):
+    identity = sizes[0]
+    cells = [f"{size:>8} (-{100 - 100 * size // max(identity, 1)}%)" for size in sizes[1:]]
+    return f"{label:<26}{identity:>10}" + "".join(f"{cell:>16}" for cell in cells)
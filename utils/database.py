@@ -0,0 +1,171 @@
+"""
+Database helpers shared by Bolaquent's write paths, plus engine setup: SQLite
+pragmas, connection pool options and pool usage metrics
+"""
+
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+from sqlalchemy.pool import QueuePool
+
+from models import db
+
+# Dialects whose INSERT supports ON CONFLICT ... DO UPDATE and RETURNING
+UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+# Oldest database versions with ON CONFLICT (SQLite adds RETURNING in 3.35)
+UPSERT_MIN_VERSIONS = {"sqlite": (3, 24), "postgresql": (9, 5)}
+
+
+def upsert_insert():
+    """Return the current bind's upsert-capable insert() or None if unsupported"""
+    dialect = db.session.get_bind().dialect
+    insert = UPSERT_DIALECTS.get(dialect.name)
+    # The dialect name is not enough: an old SQLite library has neither clause
+    if insert is None or not dialect.insert_returning:
+        return None
+    # Unknown until the engine's first connection
+    version = dialect.server_version_info
+    if version is not None and version < UPSERT_MIN_VERSIONS[dialect.name]:
+        return None
+    return insert
+
+
+def insert_ignoring_conflicts(table, index_elements, rows):
+    """Bulk insert rows, skipping those conflicting on index_elements; returns rows inserted
+
+    Runs in the caller's transaction. Without upsert support this is a plain
+    executemany insert, where a conflicting row raises IntegrityError instead.
+    """
+    insert = upsert_insert()
+    if insert is None:
+        return db.session.execute(table.insert(), rows).rowcount
+    statement = (
+        insert(table)
+        .on_conflict_do_nothing(index_elements=[table.c[name] for name in index_elements])
+        .returning(table.c.id)
+    )
+    return len(db.session.execute(statement, rows).all())
+
+
+def _set_sqlite_pragmas(pragmas):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return on_connect
+
+
+def app_engines(app):
+    """Engines used by the app: Flask-SQLAlchemy's (default and binds) plus the replica"""
+    from utils.routing import get_replica_engine
+
+    with app.app_context():
+        engines = {bind_key or "default": engine for bind_key, engine in db.engines.items()}
+    replica = get_replica_engine(app)
+    if replica is not None:
+        engines["replica"] = replica
+    return engines
+
+
+def configure_engine(app):
+    """Apply SQLITE_PRAGMAS to every SQLite engine of the app"""
+    pragmas = app.config.get("SQLITE_PRAGMAS")
+    if not pragmas:
+        return
+    for engine in app_engines(app).values():
+        if engine.dialect.name == "sqlite":
+            event.listen(engine, "connect", _set_sqlite_pragmas(pragmas))
+
+
+class PoolMetrics:
+    """Thread-safe counters for connection checkouts from one pool"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record(self, waited, timed_out=False):
+        with self.lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += waited
+            self.wait_max = max(self.wait_max, waited)
+
+    def snapshot(self):
+        with self.lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total / attempts * 1000, 3) if attempts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeout:
+            self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - started)
+        return connection
+
+
+def engine_options(config):
+    """SQLALCHEMY_ENGINE_OPTIONS with the DB_POOL_* settings filled in
+
+    Every engine gets the instrumented pool class (in-memory SQLite still uses
+    StaticPool); sizing options only apply to server databases. Explicitly
+    configured engine options win.
+    """
+    options = {"poolclass": InstrumentedQueuePool}
+    if not config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+        options.update(
+            pool_size=config["DB_POOL_SIZE"],
+            max_overflow=config["DB_MAX_OVERFLOW"],
+            pool_timeout=config["DB_POOL_TIMEOUT"],
+            pool_recycle=config["DB_POOL_RECYCLE"],
+            pool_pre_ping=config["DB_POOL_PRE_PING"],
+        )
+    options.update(config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    return options
+
+
+def pool_status(engine):
+    """Current usage of an engine's pool plus checkout metrics when instrumented"""
+    pool = engine.pool
+    status = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update(pool.metrics.snapshot())
+    return status
@@ -0,0 +1,195 @@
+"""
+Background jobs for Bolaquent
+
+Long admin tasks (vocabulary expansion) run on a small thread pool instead of
+inside the request. Each job has a BackgroundJob row holding its status,
+progress and result, so any worker can answer /admin/jobs/<id> and cancellation
+is requested by flagging the row; the job checks the flag whenever it reports
+progress.
+
+Reporting progress also refreshes the row's updated_at heartbeat. A job whose
+process died (a recycled or crashed worker, a deploy) stops beating, so queued or
+running jobs silent for longer than JOB_HEARTBEAT_TIMEOUT are marked failed at
+startup and whenever the active job is looked up. Cancelling a job that no live
+thread of this process owns finishes it directly.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from flask import current_app
+from sqlalchemy import func, inspect
+
+from models import db, BackgroundJob
+from utils.routing import use_primary
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation has been requested"""
+
+
+class JobContext:
+    """Handle passed to a running job for reporting progress"""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+    def report(self, **progress):
+        """Persist progress and raise JobCancelled if the job should stop"""
+        job = db.session.get(BackgroundJob, self.job_id, populate_existing=True)
+        if job.status in FINISHED_STATUSES:
+            # Expired or cancelled from another process; the row is already final
+            raise JobCancelled()
+        job.progress = json.dumps(progress)
+        job.updated_at = datetime.utcnow()
+        db.session.commit()
+        if job.cancel_requested:
+            raise JobCancelled()
+
+
+class JobRunner:
+    """Thread pool that executes job functions inside their own app context"""
+
+    def __init__(self, app, max_workers):
+        self.app = app
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self.futures = {}
+
+    def submit(self, kind, func, **kwargs):
+        """Record a queued job and schedule func(JobContext, **kwargs); returns the job"""
+        job = BackgroundJob(kind=kind, status="queued", created_at=datetime.utcnow())
+        db.session.add(job)
+        db.session.commit()
+        self.futures[job.id] = self.executor.submit(self._run, job.id, func, kwargs)
+        return job
+
+    def wait(self, job_id, timeout=None):
+        """Block until a job submitted by this runner finishes"""
+        future = self.futures.get(job_id)
+        if future is not None:
+            future.result(timeout)
+
+    def owns(self, job_id):
+        """Whether a thread of this runner is still queued or working on the job"""
+        future = self.futures.get(job_id)
+        return future is not None and not future.done()
+
+    def _run(self, job_id, func, kwargs):
+        with self.app.app_context():
+            job = db.session.get(BackgroundJob, job_id)
+            if job.status != "queued":
+                # Expired or cancelled before a thread picked it up
+                return
+            if job.cancel_requested:
+                _finish(job, "cancelled")
+                return
+
+            job.status = "running"
+            job.started_at = job.updated_at = datetime.utcnow()
+            db.session.commit()
+
+            try:
+                result = func(JobContext(job_id), **kwargs)
+            except JobCancelled:
+                db.session.rollback()
+                _finish_active(job_id, "cancelled")
+            except Exception as e:
+                db.session.rollback()
+                current_app.logger.exception("Background job %s failed", job_id)
+                _finish_active(job_id, "failed", error=str(e))
+            else:
+                _finish_active(job_id, "succeeded", result=result)
+            finally:
+                self.futures.pop(job_id, None)
+
+
+def _finish(job, status, result=None, error=None):
+    job.status = status
+    job.result = json.dumps(result) if result is not None else None
+    job.error = error
+    job.finished_at = job.updated_at = datetime.utcnow()
+    db.session.commit()
+
+
+def _finish_active(job_id, status, result=None, error=None):
+    # Leave rows that expired or were cancelled directly while the job ran
+    job = db.session.get(BackgroundJob, job_id, populate_existing=True)
+    if job.status in ACTIVE_STATUSES:
+        _finish(job, status, result, error)
+
+
+def init_jobs(app):
+    runner = JobRunner(app, app.config["JOB_WORKERS"])
+    app.extensions["bolaquent_jobs"] = runner
+    with app.app_context():
+        # The table does not exist yet before the first schema upgrade
+        if inspect(db.engine).has_table(BackgroundJob.__tablename__):
+            expire_stale_jobs()
+    return runner
+
+
+def get_job_runner():
+    return current_app.extensions["bolaquent_jobs"]
+
+
+def expire_stale_jobs():
+    """Fail active jobs without a heartbeat for JOB_HEARTBEAT_TIMEOUT; returns how many"""
+    timeout = current_app.config["JOB_HEARTBEAT_TIMEOUT"]
+    cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+    runner = get_job_runner()
+    # A lagging replica would show heartbeats older than they are
+    with use_primary():
+        stale = BackgroundJob.query.filter(
+            BackgroundJob.status.in_(ACTIVE_STATUSES),
+            func.coalesce(BackgroundJob.updated_at, BackgroundJob.created_at) < cutoff,
+        ).all()
+        stale = [job for job in stale if not runner.owns(job.id)]
+        for job in stale:
+            _finish(job, "failed", error=f"No progress for {timeout} seconds; its worker stopped")
+    return len(stale)
+
+
+def find_active_job(kind):
+    """Most recent queued or running job of a kind, if any, after expiring stale jobs"""
+    expire_stale_jobs()
+    return (
+        BackgroundJob.query.filter(
+            BackgroundJob.kind == kind, BackgroundJob.status.in_(ACTIVE_STATUSES)
+        )
+        .order_by(BackgroundJob.id.desc())
+        .first()
+    )
+
+
+def request_cancel(job):
+    """Flag a job for cancellation; returns False if it already finished"""
+    if job.status in FINISHED_STATUSES:
+        return False
+    job.cancel_requested = True
+    if get_job_runner().owns(job.id):
+        db.session.commit()
+    else:
+        # No thread here will see the flag; if another process still runs the job,
+        # its next report finds the row final and stops
+        _finish(job, "cancelled")
+    return True
+
+
+def job_to_dict(job):
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "progress": json.loads(job.progress) if job.progress else None,
+        "result": json.loads(job.result) if job.result else None,
+        "error": job.error,
+        "cancel_requested": job.cancel_requested,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
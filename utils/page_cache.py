@@ -0,0 +1,80 @@
+"""
+Rendered-page cache for guest learning pages
+
+Guest and demo vocabulary/practice pages differ only by tier and username, so
+they are rendered once per (endpoint, tier, vocabulary version) with a username
+placeholder, kept in a per-process LRU, and the escaped username is substituted
+on the way out. Requests with pending flash messages are rendered normally.
+Entries also expire after CACHE_DEFAULT_TTL, like the vocabulary snapshot, so
+workers that miss a version bump still converge.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app, make_response, render_template, request, session
+from markupsafe import escape
+
+from utils.cache import vocabulary_version
+
+USERNAME_PLACEHOLDER = "__bolaquent_username__"
+
+
+class LRUPageCache:
+    """Thread-safe LRU of rendered pages with per-entry expiry"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            page, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return page
+
+    def set(self, key, page, ttl):
+        with self._lock:
+            self._entries[key] = (page, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def init_page_cache(app):
+    cache = LRUPageCache(app.config["PAGE_CACHE_SIZE"])
+    app.extensions["bolaquent_page_cache"] = cache
+    return cache
+
+
+def render_guest_page(template, tier_id, build_context):
+    """Render a guest page from cache; build_context(tier_id) runs only on a miss"""
+    cache = current_app.extensions["bolaquent_page_cache"]
+    key = (request.endpoint, tier_id, vocabulary_version())
+    # Flash messages are rendered into the page, so those responses are not cached
+    bypass = bool(session.get("_flashes"))
+    page = None if bypass else cache.get(key)
+    status = "bypass" if bypass else "hit"
+    if page is None:
+        page = render_template(
+            template, nav_username=USERNAME_PLACEHOLDER, **build_context(tier_id)
+        )
+        if not bypass:
+            status = "miss"
+            cache.set(key, page, current_app.config["CACHE_DEFAULT_TTL"])
+
+    username = str(escape(session.get("username", "Guest User")))
+    response = make_response(page.replace(USERNAME_PLACEHOLDER, username))
+    response.headers["X-Page-Cache"] = status
+    return response
@@ -0,0 +1,180 @@
+"""
+Practice answer recording for Bolaquent
+
+Answers are applied with INSERT ... ON CONFLICT DO UPDATE against the unique
+(user_id, vocabulary_word_id) index, so the counters are incremented by the
+database itself and concurrent submits for the same word cannot lose updates.
+A batch of answers is folded per word and written as one multi-row statement.
+
+The upsert holds the row locks until commit, so the spaced-repetition state it
+returns is then advanced by utils.scheduler and written back by primary key in
+the same transaction.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import bindparam, func
+
+from models import db, UserProgress
+from utils.database import upsert_insert
+from utils.scheduler import replay_reviews
+from utils.stats import increment_user_stats, is_mastered
+
+SCHEDULE_FIELDS = ("ease_factor", "interval_days", "repetitions")
+
+
+def _progress_result(row):
+    return {
+        "mastery_level": row.mastery_level,
+        "attempts": row.attempts,
+        "correct_answers": row.correct_answers,
+    }
+
+
+def _fold_answers(answers):
+    """Collapse answers into one counter delta per word, preserving first-seen order"""
+    totals = {}
+    for answer in answers:
+        answered_at = answer.get("answered_at") or datetime.utcnow()
+        is_correct = bool(answer.get("is_correct"))
+        delta = totals.setdefault(
+            answer["word_id"],
+            {"attempts": 0, "correct_answers": 0, "last_practiced": answered_at, "reviews": []},
+        )
+        delta["attempts"] += 1
+        delta["correct_answers"] += 1 if is_correct else 0
+        delta["last_practiced"] = max(delta["last_practiced"], answered_at)
+        delta["reviews"].append((answered_at, is_correct))
+    return totals
+
+
+def _apply_schedules(rows, totals):
+    """Advance each returned row's review schedule and write it back in one executemany"""
+    table = UserProgress.__table__
+    updates = []
+    for row in rows:
+        state = {field: getattr(row, field) for field in SCHEDULE_FIELDS}
+        schedule = replay_reviews(state, totals[row.vocabulary_word_id]["reviews"])
+        updates.append({"progress_id": row.id, **schedule})
+
+    db.session.execute(
+        table.update().where(table.c.id == bindparam("progress_id")),
+        updates,
+    )
+
+
+def record_answers(user_id, answers):
+    """Apply a batch of answers and return updated counters keyed by word id
+
+    Each answer is a mapping with word_id, is_correct and an optional answered_at.
+    The caller owns the transaction and must commit.
+    """
+    totals = _fold_answers(answers)
+    if not totals:
+        return {}
+
+    insert = upsert_insert()
+    if insert is None:
+        results = {
+            word_id: _record_locked(user_id, word_id, delta) for word_id, delta in totals.items()
+        }
+        _update_stats(user_id, results, totals)
+        return results
+
+    table = UserProgress.__table__
+    statement = insert(table).values(
+        [
+            {
+                "user_id": user_id,
+                "vocabulary_word_id": word_id,
+                "attempts": delta["attempts"],
+                "correct_answers": delta["correct_answers"],
+                "mastery_level": delta["correct_answers"] * 100 // delta["attempts"],
+                "last_practiced": delta["last_practiced"],
+            }
+            for word_id, delta in totals.items()
+        ]
+    )
+    attempts = func.coalesce(table.c.attempts, 0) + statement.excluded.attempts
+    correct_answers = func.coalesce(table.c.correct_answers, 0) + statement.excluded.correct_answers
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.vocabulary_word_id],
+        set_={
+            "attempts": attempts,
+            "correct_answers": correct_answers,
+            # Integer division matches the previous int(accuracy * 100)
+            "mastery_level": correct_answers * 100 // attempts,
+            "last_practiced": statement.excluded.last_practiced,
+        },
+    ).returning(
+        table.c.id,
+        table.c.vocabulary_word_id,
+        table.c.mastery_level,
+        table.c.attempts,
+        table.c.correct_answers,
+        *[table.c[field] for field in SCHEDULE_FIELDS],
+    )
+
+    rows = db.session.execute(statement).all()
+    _apply_schedules(rows, totals)
+
+    results = {row.vocabulary_word_id: _progress_result(row) for row in rows}
+    _update_stats(user_id, results, totals)
+    return results
+
+
+def _update_stats(user_id, results, totals):
+    """Fold this batch into the user's summary row, counting mastery crossings"""
+    mastered = 0
+    for word_id, result in results.items():
+        delta = totals[word_id]
+        previous_attempts = result["attempts"] - delta["attempts"]
+        previous_correct = result["correct_answers"] - delta["correct_answers"]
+        was_mastered = previous_attempts > 0 and is_mastered(
+            previous_correct * 100 // previous_attempts
+        )
+        mastered += int(is_mastered(result["mastery_level"])) - int(was_mastered)
+
+    increment_user_stats(
+        user_id,
+        attempts=sum(delta["attempts"] for delta in totals.values()),
+        correct_answers=sum(delta["correct_answers"] for delta in totals.values()),
+        mastered=mastered,
+        last_practiced=max(delta["last_practiced"] for delta in totals.values()),
+    )
+
+
+def record_answer(user_id, word_id, is_correct, answered_at=None):
+    """Apply one answer to the user's progress and return the updated counters"""
+    answer = {"word_id": word_id, "is_correct": is_correct, "answered_at": answered_at}
+    return record_answers(user_id, [answer])[word_id]
+
+
+def _record_locked(user_id, word_id, delta):
+    """Row-locking fallback for databases without ON CONFLICT support"""
+    progress = (
+        UserProgress.query.filter_by(user_id=user_id, vocabulary_word_id=word_id)
+        .with_for_update()
+        .first()
+    )
+    if not progress:
+        progress = UserProgress(
+            user_id=user_id,
+            vocabulary_word_id=word_id,
+            attempts=0,
+            correct_answers=0,
+            mastery_level=0,
+        )
+        db.session.add(progress)
+
+    progress.attempts += delta["attempts"]
+    progress.correct_answers += delta["correct_answers"]
+    progress.mastery_level = progress.correct_answers * 100 // progress.attempts
+    progress.last_practiced = delta["last_practiced"]
+
+    state = {field: getattr(progress, field) for field in SCHEDULE_FIELDS}
+    for field, value in replay_reviews(state, delta["reviews"]).items():
+        setattr(progress, field, value)
+    db.session.flush()
+
+    return _progress_result(progress)
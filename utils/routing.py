@@ -0,0 +1,102 @@
+"""
+Read-replica routing for Bolaquent
+
+When SQLALCHEMY_REPLICA_URI is configured, an engine for it is attached to the
+app. It is not a Flask-SQLAlchemy bind, since binds register their own metadata. Views
+decorated with @read_only send their queries there; everything else, and any
+flush or INSERT/UPDATE/DELETE even inside a read-only view, uses the primary.
+Code in a read-only view that writes what it read (rebuilding a summary row)
+runs its reads on the primary too, inside `with use_primary():`.
+
+After a request writes, the time is stored in the user's session and that user's
+read-only views stay on the primary for REPLICA_STICKY_SECONDS, so they see their
+own answers and additions before the replica catches up.
+"""
+
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from flask import current_app, g, has_request_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event
+
+REPLICA_EXTENSION = "bolaquent_replica"
+LAST_WRITE_KEY = "_db_last_write"
+
+
+def read_only(view):
+    """Mark a view as safe to serve from the read replica"""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_read_only = True
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def use_primary():
+    """Read from the primary inside this block, even in a @read_only view"""
+    if not has_request_context():
+        yield
+        return
+    previous = g.get("db_read_only", False)
+    g.db_read_only = False
+    try:
+        yield
+    finally:
+        g.db_read_only = previous
+
+
+def configure_replica(app):
+    """Create the replica engine from SQLALCHEMY_REPLICA_URI, if configured"""
+    uri = app.config.get("SQLALCHEMY_REPLICA_URI")
+    if uri:
+        engine = create_engine(uri, **app.config["SQLALCHEMY_ENGINE_OPTIONS"])
+        app.extensions[REPLICA_EXTENSION] = engine
+        return engine
+
+
+def get_replica_engine(app=None):
+    return (app or current_app).extensions.get(REPLICA_EXTENSION)
+
+
+def _recently_wrote():
+    last_write = session.get(LAST_WRITE_KEY)
+    return last_write is not None and (
+        time.time() - last_write < current_app.config["REPLICA_STICKY_SECONDS"]
+    )
+
+
+class RoutingSession(Session):
+    """Session that reads from the replica inside @read_only views"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self._use_replica(clause):
+            return get_replica_engine()
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+    def _use_replica(self, clause):
+        if self._flushing or getattr(clause, "is_dml", False):
+            return False
+        if not has_request_context() or not g.get("db_read_only"):
+            return False
+        if get_replica_engine() is None:
+            return False
+        return not _recently_wrote()
+
+
+def _record_write(db_session, flush_context):
+    if has_request_context():
+        session[LAST_WRITE_KEY] = time.time()
+
+
+def _record_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _record_write(orm_execute_state.session, None)
+
+
+event.listen(RoutingSession, "after_flush", _record_write)
+event.listen(RoutingSession, "do_orm_execute", _record_dml)
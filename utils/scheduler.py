@@ -0,0 +1,100 @@
+"""
+Spaced-repetition scheduling for Bolaquent
+
+A compact SM-2 variant: practice answers are graded right/wrong, so each maps to a
+fixed SM-2 quality. Correct answers grow the review interval (1 day, 6 days, then
+interval * ease); a wrong answer resets the word to a short relearning step.
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import exists
+
+from models import db, UserProgress, VocabularyWord
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+CORRECT_QUALITY = 4
+INCORRECT_QUALITY = 2
+RELEARN_STEP = timedelta(minutes=10)
+
+
+def schedule_review(state, is_correct, reviewed_at):
+    """Return the scheduling state after one answer
+
+    state holds ease_factor, interval_days and repetitions; missing or None values
+    are treated as a word that has never been reviewed.
+    """
+    ease = state.get("ease_factor") or DEFAULT_EASE
+    interval = state.get("interval_days") or 0
+    repetitions = state.get("repetitions") or 0
+    quality = CORRECT_QUALITY if is_correct else INCORRECT_QUALITY
+
+    if is_correct:
+        if repetitions == 0:
+            interval = 1
+        elif repetitions == 1:
+            interval = 6
+        else:
+            interval = max(1, round(interval * ease))
+        repetitions += 1
+        next_review_date = reviewed_at + timedelta(days=interval)
+    else:
+        interval = 0
+        repetitions = 0
+        next_review_date = reviewed_at + RELEARN_STEP
+
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+
+    return {
+        "ease_factor": round(ease, 2),
+        "interval_days": interval,
+        "repetitions": repetitions,
+        "next_review_date": next_review_date,
+    }
+
+
+def replay_reviews(state, reviews):
+    """Apply (reviewed_at, is_correct) pairs in time order to a scheduling state"""
+    for reviewed_at, is_correct in sorted(reviews, key=lambda review: review[0]):
+        state = schedule_review(state, is_correct, reviewed_at)
+    return state
+
+
+def select_practice_words(user_id, tier_id, limit, now=None):
+    """Pick a practice session: due reviews first, then words never practiced
+
+    Due reviews come from a range scan on (user_id, next_review_date); new words
+    are probed against the unique (user_id, vocabulary_word_id) index in id order,
+    so both halves stop after `limit` rows instead of joining the whole tier.
+    """
+    now = now or datetime.utcnow()
+
+    words = (
+        db.session.query(VocabularyWord)
+        .join(UserProgress, UserProgress.vocabulary_word_id == VocabularyWord.id)
+        .filter(
+            UserProgress.user_id == user_id,
+            UserProgress.next_review_date <= now,
+            # Progress on another tier's words stays, but is not reviewed from this tier
+            VocabularyWord.tier_id == tier_id,
+        )
+        .order_by(UserProgress.next_review_date)
+        .limit(limit)
+        .all()
+    )
+
+    remaining = limit - len(words)
+    if remaining > 0:
+        practiced = exists().where(
+            UserProgress.user_id == user_id,
+            UserProgress.vocabulary_word_id == VocabularyWord.id,
+        )
+        words += (
+            VocabularyWord.query.filter(VocabularyWord.tier_id == tier_id, ~practiced)
+            .order_by(VocabularyWord.id)
+            .limit(remaining)
+            .all()
+        )
+
+    return words
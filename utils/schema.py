@@ -0,0 +1,287 @@
+"""
+Schema maintenance for Bolaquent databases
+
+db.create_all() only creates missing tables, so columns and indexes declared on
+models after a database was first created never reach it. These helpers compare
+the models against the live database and apply whatever is missing.
+"""
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import bindparam, func, inspect, text
+
+from models import db, normalize_word, UserProgress, VocabularyWord
+from utils.cache import invalidate_vocabulary
+from utils.stats import rebuild_user_stats, refresh_tier_totals
+
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def missing_columns():
+    """Return model-declared columns that do not exist in the database"""
+    inspector = inspect(db.engine)
+    missing = []
+
+    for table in db.metadata.sorted_tables:
+        # Tables that don't exist yet are created whole by create_all()
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing.extend(column for column in table.columns if column.name not in existing)
+
+    return missing
+
+
+def missing_indexes():
+    """Return model-declared indexes that do not exist in the database"""
+    inspector = inspect(db.engine)
+    missing = []
+
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name not in existing:
+                missing.append(index)
+
+    return missing
+
+
+def count_duplicates(index):
+    """Count key groups that would violate a unique index"""
+    columns = list(index.columns)
+    duplicates = (
+        db.select(*columns)
+        .where(*[column.isnot(None) for column in columns])
+        .group_by(*columns)
+        .having(func.count() > 1)
+        .subquery()
+    )
+    return db.session.execute(db.select(func.count()).select_from(duplicates)).scalar()
+
+
+def add_column(column):
+    """Add a nullable column to an existing table"""
+    column_type = column.type.compile(dialect=db.engine.dialect)
+    with db.engine.begin() as connection:
+        connection.execute(
+            text(f"ALTER TABLE {column.table.name} ADD COLUMN {column.name} {column_type}")
+        )
+
+
+def backfill_review_dates():
+    """Make progress rows recorded before scheduling existed due immediately"""
+    table = UserProgress.__table__
+    result = db.session.execute(
+        table.update()
+        .where(table.c.next_review_date.is_(None), table.c.vocabulary_word_id.isnot(None))
+        .values(next_review_date=func.coalesce(table.c.last_practiced, func.current_timestamp()))
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def backfill_word_keys():
+    """Fill vocabulary_words.word_key for rows stored before the column existed"""
+    table = VocabularyWord.__table__
+    update = (
+        table.update().where(table.c.id == bindparam("row_id")).values(word_key=bindparam("key"))
+    )
+    count = 0
+    while True:
+        rows = db.session.execute(
+            db.select(table.c.id, table.c.word)
+            .where(table.c.word_key.is_(None))
+            .order_by(table.c.id)
+            .limit(BACKFILL_CHUNK_SIZE)
+        ).all()
+        if not rows:
+            return count
+        db.session.execute(
+            update, [{"row_id": id_, "key": normalize_word(word)} for id_, word in rows]
+        )
+        db.session.commit()
+        count += len(rows)
+
+
+def _fold_progress(user_id, word_ids, keep_word_id):
+    """Merge a user's progress rows on word_ids into one row on keep_word_id
+
+    Counters are summed, mastery recomputed, and the latest practice and earliest
+    review date kept. Returns rows deleted.
+    """
+    table = UserProgress.__table__
+    rows = (table.c.user_id == user_id, table.c.vocabulary_word_id.in_(word_ids))
+    keep_id, attempts, correct, last_practiced, next_review = db.session.execute(
+        db.select(
+            func.min(table.c.id),
+            func.sum(func.coalesce(table.c.attempts, 0)),
+            func.sum(func.coalesce(table.c.correct_answers, 0)),
+            func.max(table.c.last_practiced),
+            func.min(table.c.next_review_date),
+        ).where(*rows)
+    ).one()
+    # Delete first so moving the kept row cannot collide with the unique index
+    deleted = db.session.execute(table.delete().where(*rows, table.c.id != keep_id)).rowcount
+    db.session.execute(
+        table.update()
+        .where(table.c.id == keep_id)
+        .values(
+            vocabulary_word_id=keep_word_id,
+            attempts=attempts,
+            correct_answers=correct,
+            mastery_level=correct * 100 // attempts if attempts else 0,
+            last_practiced=last_practiced,
+            next_review_date=next_review,
+        )
+    )
+    return deleted
+
+
+def merge_duplicate_words():
+    """Fold vocabulary words repeating a tier's word_key into the oldest one
+
+    Words stored before word keys existed can differ only in case or whitespace,
+    which blocks the unique (tier_id, word_key) index that seeding and expansion
+    insert against. Progress on the extra rows is folded into the kept word's
+    before they are deleted. Returns words deleted.
+    """
+    table = VocabularyWord.__table__
+    progress = UserProgress.__table__
+    groups = db.session.execute(
+        db.select(table.c.tier_id, table.c.word_key, func.min(table.c.id))
+        .where(table.c.word_key.isnot(None))
+        .group_by(table.c.tier_id, table.c.word_key)
+        .having(func.count() > 1)
+    ).all()
+
+    deleted = 0
+    user_ids = set()
+    for tier_id, word_key, keep_id in groups:
+        word_ids = (
+            db.session.execute(
+                db.select(table.c.id).where(
+                    table.c.tier_id == tier_id, table.c.word_key == word_key
+                )
+            )
+            .scalars()
+            .all()
+        )
+        duplicate_ids = [word_id for word_id in word_ids if word_id != keep_id]
+        learners = db.session.execute(
+            db.select(progress.c.user_id)
+            .where(progress.c.vocabulary_word_id.in_(duplicate_ids))
+            .distinct()
+        )
+        for user_id in learners.scalars().all():
+            _fold_progress(user_id, word_ids, keep_id)
+            user_ids.add(user_id)
+        deleted += db.session.execute(table.delete().where(table.c.id.in_(duplicate_ids))).rowcount
+
+    for tier_id in sorted({group[0] for group in groups}):
+        refresh_tier_totals(tier_id)
+    if user_ids:
+        rebuild_user_stats(sorted(user_ids))
+    db.session.commit()
+    if groups:
+        invalidate_vocabulary()
+    return deleted
+
+
+def merge_duplicate_progress():
+    """Fold user_progress rows repeating a (user, word) pair into the oldest one
+
+    Answers recorded before the upsert could race into duplicate rows, which block
+    the unique index the upsert relies on. Returns rows deleted.
+    """
+    table = UserProgress.__table__
+    groups = db.session.execute(
+        db.select(table.c.user_id, table.c.vocabulary_word_id)
+        .where(table.c.vocabulary_word_id.isnot(None))
+        .group_by(table.c.user_id, table.c.vocabulary_word_id)
+        .having(func.count() > 1)
+    ).all()
+
+    deleted = sum(_fold_progress(user_id, [word_id], word_id) for user_id, word_id in groups)
+    if groups:
+        rebuild_user_stats(sorted({user_id for user_id, _ in groups}))
+    db.session.commit()
+    return deleted
+
+
+# Data fixes run after every upgrade; each must be idempotent and return a row count
+BACKFILLS = [
+    ("user_progress.next_review_date", backfill_review_dates),
+    ("vocabulary_words.word_key", backfill_word_keys),
+    ("vocabulary_words duplicates", merge_duplicate_words),
+    ("user_progress duplicates", merge_duplicate_progress),
+]
+
+
+def upgrade_schema():
+    """Create missing tables and columns, run backfills, then create missing indexes
+
+    Backfills run first so unique indexes over backfilled columns (such as
+    vocabulary word keys) are checked against real values. Returns a report dict
+    with "created" (column and index names), "skipped" (unique indexes whose
+    existing rows still contain duplicate keys after the merge backfills) and
+    "backfilled" (rows touched per backfill).
+    """
+    db.create_all()
+
+    created = []
+    for column in missing_columns():
+        add_column(column)
+        created.append(f"{column.table.name}.{column.name}")
+
+    backfilled = {name: backfill() for name, backfill in BACKFILLS}
+
+    skipped = []
+    for index in missing_indexes():
+        if index.unique and count_duplicates(index):
+            skipped.append(index.name)
+            continue
+        index.create(db.engine)
+        created.append(index.name)
+
+    return {"created": created, "skipped": skipped, "backfilled": backfilled}
+
+
+@click.command("schema-check")
+@with_appcontext
+def schema_check_command():
+    """Report columns and indexes declared on the models but missing from the database."""
+    columns = missing_columns()
+    indexes = missing_indexes()
+    if not columns and not indexes:
+        click.echo("Schema OK: all declared columns and indexes exist")
+        return
+
+    for column in columns:
+        click.echo(f"Missing column {column.table.name}.{column.name}")
+    for index in indexes:
+        names = ", ".join(column.name for column in index.columns)
+        kind = "unique index" if index.unique else "index"
+        click.echo(f"Missing {kind} {index.name} on {index.table.name} ({names})")
+    raise SystemExit(1)
+
+
+@click.command("schema-upgrade")
+@with_appcontext
+def schema_upgrade_command():
+    """Create missing tables, columns and indexes and run data backfills."""
+    report = upgrade_schema()
+    for name in report["created"]:
+        click.echo(f"Created {name}")
+    for name in report["skipped"]:
+        click.echo(f"Skipped unique index {name}: existing rows contain duplicate keys")
+    for name, count in report["backfilled"].items():
+        if count:
+            click.echo(f"Backfilled {count} rows of {name}")
+    if not report["created"] and not report["skipped"]:
+        click.echo("Schema already up to date")
+    if report["skipped"]:
+        raise SystemExit(1)
@@ -0,0 +1,216 @@
+"""
+Seed data for Bolaquent
+
+Seed corpora live in data/*.jsonl, one mapping per line, and are only read when
+seeding. Rows are inserted with executemany as plain mappings, so nothing builds
+ORM objects for words that may never be touched, and words already in a tier (by
+word_key) are skipped.
+
+The base seed (age tiers and sample vocabulary, applied by /init-db) is hashed
+and the hash stored in app_metadata. Re-seeding with unchanged files is a single
+lookup; when the files change only the missing or changed rows are written, in
+one transaction.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import bindparam, tuple_
+
+from models import db, normalize_word, AgeTier, AppMetadata, VocabularyWord
+from utils.cache import invalidate_vocabulary
+from utils.database import insert_ignoring_conflicts
+from utils.stats import refresh_tier_totals
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+EXPANDED_VOCABULARY = os.path.join(DATA_DIR, "expanded_vocabulary.jsonl")
+AGE_TIERS = os.path.join(DATA_DIR, "age_tiers.jsonl")
+SAMPLE_VOCABULARY = os.path.join(DATA_DIR, "sample_vocabulary.jsonl")
+SEED_CHUNK_SIZE = 500
+
+SEED_HASH_KEY = "seed_hash"
+TIER_FIELDS = (
+    "name",
+    "min_age",
+    "max_age",
+    "description",
+    "cognitive_stage",
+    "attention_span_minutes",
+    "words_per_session",
+)
+WORD_FIELDS = ("definition", "part_of_speech", "category")
+
+# Unique key of vocabulary_words (uq_vocabulary_words_tier_word_key)
+WORD_KEY_COLUMNS = ("tier_id", "word_key")
+
+
+def iter_seed_file(path=EXPANDED_VOCABULARY):
+    """Yield row mappings from a JSON lines seed file, one line at a time"""
+    with open(path, encoding="utf-8") as seed_file:
+        for line in seed_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def insert_vocabulary(rows):
+    """Insert word mappings, skipping words already in their tier; returns rows inserted
+
+    Runs in the caller's transaction. Missing word_key values are filled in.
+    """
+    for row in rows:
+        row.setdefault("word_key", normalize_word(row["word"]))
+    return insert_ignoring_conflicts(VocabularyWord.__table__, WORD_KEY_COLUMNS, rows)
+
+
+def seed_vocabulary(path=EXPANDED_VOCABULARY, chunk_size=SEED_CHUNK_SIZE):
+    """Load a seed file into vocabulary_words; returns words inserted per tier id"""
+    words = iter_seed_file(path)
+    added = {}
+    while True:
+        chunk = list(itertools.islice(words, chunk_size))
+        if not chunk:
+            break
+        for tier_id, rows in itertools.groupby(chunk, key=lambda row: row["tier_id"]):
+            added[tier_id] = added.get(tier_id, 0) + insert_vocabulary(list(rows))
+
+    for tier_id in added:
+        refresh_tier_totals(tier_id)
+    db.session.commit()
+    invalidate_vocabulary()
+    return added
+
+
+def seed_hash(paths=None):
+    """SHA-256 over the seed files' names and contents (default: the base seed)"""
+    digest = hashlib.sha256()
+    for path in paths or (AGE_TIERS, SAMPLE_VOCABULARY):
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as seed_file:
+            digest.update(seed_file.read())
+    return digest.hexdigest()
+
+
+def _update_changed(table, key, rows, existing, fields):
+    """executemany UPDATE for rows whose fields differ from existing[key]; returns count"""
+    changed = [
+        row
+        for row in rows
+        if row[key] in existing
+        and any(row.get(field) != existing[row[key]][field] for field in fields)
+    ]
+    if changed:
+        statement = (
+            table.update()
+            .where(table.c.id == bindparam("row_id"))
+            .values({field: bindparam(field) for field in fields})
+        )
+        db.session.execute(
+            statement,
+            [
+                {"row_id": existing[row[key]]["id"], **{field: row.get(field) for field in fields}}
+                for row in changed
+            ],
+        )
+    return len(changed)
+
+
+def _seed_tiers(rows):
+    table = AgeTier.__table__
+    existing = {
+        row["id"]: row
+        for row in db.session.execute(db.select(table.c.id, *[table.c[f] for f in TIER_FIELDS]))
+        .mappings()
+        .all()
+    }
+    new_rows = [row for row in rows if row["id"] not in existing]
+    inserted = 0
+    if new_rows:
+        inserted = insert_ignoring_conflicts(table, ["id"], new_rows)
+    return {
+        "inserted": inserted,
+        "updated": _update_changed(table, "id", rows, existing, TIER_FIELDS),
+    }
+
+
+def _seed_words(rows):
+    table = VocabularyWord.__table__
+    for row in rows:
+        row["word_key"] = normalize_word(row["word"])
+        row["key"] = (row["tier_id"], row["word_key"])
+    columns = [table.c.id, table.c.tier_id, table.c.word_key, *[table.c[f] for f in WORD_FIELDS]]
+    existing = {}
+    keys = [row["key"] for row in rows]
+    for start in range(0, len(keys), SEED_CHUNK_SIZE):
+        chunk = keys[start : start + SEED_CHUNK_SIZE]
+        result = db.session.execute(
+            db.select(*columns).where(tuple_(table.c.tier_id, table.c.word_key).in_(chunk))
+        )
+        for row in result.mappings():
+            existing[(row["tier_id"], row["word_key"])] = row
+
+    updated = _update_changed(table, "key", rows, existing, WORD_FIELDS)
+    new_rows = [
+        {name: value for name, value in row.items() if name != "key"}
+        for row in rows
+        if row["key"] not in existing
+    ]
+    inserted = insert_vocabulary(new_rows) if new_rows else 0
+    tier_ids = {row["tier_id"] for row in new_rows}
+    return {"inserted": inserted, "updated": updated, "tier_ids": tier_ids}
+
+
+def seed_database(force=False):
+    """Apply the base seed (tiers and sample vocabulary) if it changed since last applied
+
+    Returns None when the stored seed hash already matches (unless force), else a
+    report of rows inserted and updated. Rows missing from the seed files, such as
+    expanded or admin-added words, are never deleted.
+    """
+    current_hash = seed_hash()
+    stored = db.session.get(AppMetadata, SEED_HASH_KEY)
+    if stored is not None and stored.value == current_hash and not force:
+        return None
+
+    tiers = _seed_tiers(list(iter_seed_file(AGE_TIERS)))
+    words = _seed_words(list(iter_seed_file(SAMPLE_VOCABULARY)))
+    for tier_id in words.pop("tier_ids"):
+        refresh_tier_totals(tier_id)
+    db.session.merge(AppMetadata(key=SEED_HASH_KEY, value=current_hash))
+    db.session.commit()
+
+    if tiers["inserted"] or tiers["updated"] or words["inserted"] or words["updated"]:
+        invalidate_vocabulary()
+    return {"hash": current_hash, "tiers": tiers, "words": words}
+
+
+@click.command("seed-database")
+@click.option("--force", is_flag=True, help="Re-apply even if the seed hash is unchanged.")
+@with_appcontext
+def seed_database_command(force):
+    """Create tables and apply the age tier and sample vocabulary seed."""
+    db.create_all()
+    report = seed_database(force)
+    if report is None:
+        click.echo("Seed data already applied")
+        return
+    for name in ("tiers", "words"):
+        counts = report[name]
+        click.echo(
+            f"{name.capitalize()}: {counts['inserted']} inserted, {counts['updated']} updated"
+        )
+    click.echo(f"Seed hash {report['hash'][:12]}")
+
+
+@click.command("seed-vocabulary")
+@click.argument("path", default=EXPANDED_VOCABULARY, type=click.Path(exists=True))
+@with_appcontext
+def seed_vocabulary_command(path):
+    """Insert words from a JSON lines seed file, skipping ones already present."""
+    added = seed_vocabulary(path)
+    for tier_id, count in sorted(added.items()):
+        click.echo(f"Tier {tier_id}: added {count} words")
+    click.echo(f"Added {sum(added.values())} words from {os.path.basename(path)}")
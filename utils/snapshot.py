@@ -0,0 +1,105 @@
+"""
+In-memory vocabulary snapshot for guest and demo sessions
+
+Every guest of a tier sees the same first words of that tier, so the guest
+vocabulary and practice pages read them from an immutable per-tier snapshot of
+tuples instead of querying. The snapshot is rebuilt with one query when the
+vocabulary version changes (invalidate_vocabulary) or, since other worker
+processes only see version bumps through a shared cache, once it is older than
+CACHE_DEFAULT_TTL.
+"""
+
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+from flask import current_app
+from sqlalchemy import func
+
+from models import db, VocabularyWord
+from utils.cache import vocabulary_version
+
+# Words kept per tier: the most any guest page shows
+SNAPSHOT_SIZE = 20
+
+SnapshotWord = namedtuple(
+    "SnapshotWord", "id word definition part_of_speech category difficulty_level"
+)
+
+
+class VocabularySnapshot:
+    """First SNAPSHOT_SIZE words of every tier, as read-only tuples"""
+
+    __slots__ = ("version", "built_at", "tiers")
+
+    def __init__(self, version, tiers):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.tiers = MappingProxyType(tiers)
+
+    def words(self, tier_id, limit=SNAPSHOT_SIZE):
+        return self.tiers.get(tier_id, ())[:limit]
+
+
+def build_snapshot(version):
+    """Load the first SNAPSHOT_SIZE words (by id) of every tier in one query"""
+    position = (
+        func.row_number()
+        .over(partition_by=VocabularyWord.tier_id, order_by=VocabularyWord.id)
+        .label("position")
+    )
+    columns = [getattr(VocabularyWord, name) for name in SnapshotWord._fields]
+    ranked = db.select(VocabularyWord.tier_id, *columns, position).subquery()
+    rows = db.session.execute(
+        db.select(ranked)
+        .where(ranked.c.position <= SNAPSHOT_SIZE)
+        .order_by(ranked.c.tier_id, ranked.c.position)
+    )
+
+    tiers = {}
+    for row in rows:
+        tiers.setdefault(row.tier_id, []).append(
+            SnapshotWord(*(getattr(row, name) for name in SnapshotWord._fields))
+        )
+    return VocabularySnapshot(version, {tier_id: tuple(words) for tier_id, words in tiers.items()})
+
+
+class SnapshotHolder:
+    """Per-process owner of the current snapshot; rebuilds it when stale"""
+
+    def __init__(self):
+        self.snapshot = None
+        self.lock = threading.Lock()
+
+    def current(self):
+        version = vocabulary_version()
+        max_age = current_app.config["CACHE_DEFAULT_TTL"]
+        snapshot = self.snapshot
+        if snapshot is None or snapshot.version != version or _age(snapshot) > max_age:
+            with self.lock:
+                snapshot = self.snapshot
+                if snapshot is None or snapshot.version != version or _age(snapshot) > max_age:
+                    snapshot = self.snapshot = build_snapshot(version)
+        return snapshot
+
+
+def _age(snapshot):
+    return time.monotonic() - snapshot.built_at
+
+
+def init_snapshot(app):
+    holder = SnapshotHolder()
+    app.extensions["bolaquent_vocabulary_snapshot"] = holder
+    return holder
+
+
+def get_guest_words(tier_id, limit=SNAPSHOT_SIZE):
+    """The first `limit` words of a tier, from the snapshot (no query when fresh)"""
+    return current_app.extensions["bolaquent_vocabulary_snapshot"].current().words(tier_id, limit)
+
+
+def warm_snapshot(app):
+    """Build the snapshot ahead of the first guest request (e.g. before forking workers)"""
+    with app.app_context():
+        return app.extensions["bolaquent_vocabulary_snapshot"].current()
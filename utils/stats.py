@@ -0,0 +1,163 @@
+"""
+Per-user progress summaries for Bolaquent
+
+The dashboard and achievements pages read a single UserStats row by primary key
+instead of counting tier vocabulary and mastered progress on every view. Answer
+submission increments the row in place; rebuild_user_stats() recomputes rows from
+the progress table when they are missing or suspected stale.
+"""
+
+from datetime import datetime
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import case, func
+
+from models import db, User, UserProgress, UserStats, VocabularyWord
+from utils.database import upsert_insert
+from utils.routing import use_primary
+
+MASTERED_LEVEL = 80
+REBUILD_CHUNK_SIZE = 1000
+SUMMARY_FIELDS = (
+    "tier_id",
+    "total_words",
+    "mastered_count",
+    "attempts",
+    "correct_answers",
+    "last_practiced",
+    "updated_at",
+)
+
+
+def is_mastered(mastery_level):
+    return mastery_level is not None and mastery_level >= MASTERED_LEVEL
+
+
+def increment_user_stats(user_id, attempts, correct_answers, mastered, last_practiced):
+    """Add one submission's deltas to the user's summary row
+
+    Runs in the caller's transaction. A user without a summary row yet gets one
+    rebuilt from the progress table, which already includes this submission.
+    """
+    table = UserStats.__table__
+    result = db.session.execute(
+        table.update()
+        .where(table.c.user_id == user_id)
+        .values(
+            attempts=func.coalesce(table.c.attempts, 0) + attempts,
+            correct_answers=func.coalesce(table.c.correct_answers, 0) + correct_answers,
+            mastered_count=func.coalesce(table.c.mastered_count, 0) + mastered,
+            last_practiced=case(
+                (table.c.last_practiced > last_practiced, table.c.last_practiced),
+                else_=last_practiced,
+            ),
+            updated_at=datetime.utcnow(),
+        )
+    )
+    if result.rowcount == 0:
+        rebuild_user_stats([user_id])
+
+
+def rebuild_user_stats(user_ids=None):
+    """Recompute summary rows from user_progress for the given users (default: all)
+
+    Runs in the caller's transaction and returns the number of rows written.
+    """
+    users = db.select(User.id, User.tier_id)
+    progress = (
+        db.select(
+            UserProgress.user_id,
+            func.sum(case((UserProgress.mastery_level >= MASTERED_LEVEL, 1), else_=0)),
+            func.sum(UserProgress.attempts),
+            func.sum(UserProgress.correct_answers),
+            func.max(UserProgress.last_practiced),
+        )
+        .where(UserProgress.vocabulary_word_id.isnot(None))
+        .group_by(UserProgress.user_id)
+    )
+    if user_ids is not None:
+        users = users.where(User.id.in_(user_ids))
+        progress = progress.where(UserProgress.user_id.in_(user_ids))
+
+    word_totals = dict(
+        db.session.execute(
+            db.select(VocabularyWord.tier_id, func.count()).group_by(VocabularyWord.tier_id)
+        ).all()
+    )
+    totals = {row[0]: row[1:] for row in db.session.execute(progress)}
+
+    now = datetime.utcnow()
+    rows = []
+    for user_id, tier_id in db.session.execute(users):
+        mastered, attempts, correct_answers, last_practiced = totals.get(user_id, (0, 0, 0, None))
+        rows.append(
+            {
+                "user_id": user_id,
+                "tier_id": tier_id,
+                "total_words": word_totals.get(tier_id, 0),
+                "mastered_count": mastered or 0,
+                "attempts": attempts or 0,
+                "correct_answers": correct_answers or 0,
+                "last_practiced": last_practiced,
+                "updated_at": now,
+            }
+        )
+
+    for start in range(0, len(rows), REBUILD_CHUNK_SIZE):
+        _write_summaries(rows[start : start + REBUILD_CHUNK_SIZE])
+    return len(rows)
+
+
+def _write_summaries(rows):
+    table = UserStats.__table__
+    insert = upsert_insert()
+    if insert is None:
+        db.session.execute(
+            table.delete().where(table.c.user_id.in_([row["user_id"] for row in rows]))
+        )
+        db.session.execute(table.insert(), rows)
+        return
+
+    statement = insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.user_id],
+        set_={field: statement.excluded[field] for field in SUMMARY_FIELDS},
+    )
+    db.session.execute(statement, rows)
+
+
+def refresh_tier_totals(tier_id):
+    """Re-sync total_words on every summary row in a tier after vocabulary changes"""
+    table = UserStats.__table__
+    word_count = (
+        db.select(func.count())
+        .select_from(VocabularyWord)
+        .where(VocabularyWord.tier_id == tier_id)
+        .scalar_subquery()
+    )
+    db.session.execute(
+        table.update().where(table.c.tier_id == tier_id).values(total_words=word_count)
+    )
+
+
+def get_user_stats(user):
+    """Return the user's summary row, rebuilding it if missing or from another tier"""
+    stats = db.session.get(UserStats, user.id)
+    if stats is None or stats.tier_id != user.tier_id:
+        # A lagging replica would rebuild the primary's row from stale progress
+        with use_primary():
+            rebuild_user_stats([user.id])
+            db.session.commit()
+            stats = db.session.get(UserStats, user.id, populate_existing=True)
+    return stats
+
+
+@click.command("rebuild-user-stats")
+@click.option("--user-id", "user_ids", type=int, multiple=True, help="Limit to these users.")
+@with_appcontext
+def rebuild_user_stats_command(user_ids):
+    """Recompute per-user progress summaries from user_progress."""
+    count = rebuild_user_stats(list(user_ids) or None)
+    db.session.commit()
+    click.echo(f"Rebuilt {count} user summaries")
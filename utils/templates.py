@@ -0,0 +1,36 @@
+"""
+Jinja template compilation caching for Bolaquent
+
+Jinja compiles each template to Python the first time a worker renders it, and
+the largest pages (learning/practice.html, admin/dashboard.html) take long
+enough that the first request after a deploy or worker recycle is visibly slow.
+init_templates() gives the environment a FileSystemBytecodeCache, so a compiled
+template is written once to TEMPLATE_CACHE_DIR and later workers only load it;
+entries are keyed by a checksum of the source, so edited templates recompile.
+warm_templates() compiles every template up front, and create_app runs it when
+TEMPLATE_PRECOMPILE is set.
+"""
+
+import os
+
+from jinja2 import FileSystemBytecodeCache
+
+
+def init_templates(app):
+    if not app.config["TEMPLATE_BYTECODE_CACHE"]:
+        return None
+    directory = app.config["TEMPLATE_CACHE_DIR"]
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # None lets Jinja pick a private directory under the system temp dir
+    cache = FileSystemBytecodeCache(directory or None)
+    app.jinja_env.bytecode_cache = cache
+    return cache
+
+
+def warm_templates(app):
+    """Compile every HTML template into the environment (and bytecode) cache; returns the count"""
+    names = [name for name in app.jinja_env.list_templates() if name.endswith(".html")]
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names)
@@ -0,0 +1,27 @@
+"""
+Production WSGI entry point for Bolaquent
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+With preload_app (see gunicorn.conf.py) this module is imported once in the
+gunicorn master: the schema is upgraded (missing tables, columns and indexes),
+every template is compiled and the guest vocabulary snapshot is built before the
+workers are forked, so each worker starts with them warm. Database connections
+opened while warming are closed again, since forked workers must not share them.
+"""
+
+from app import create_app
+from utils.database import app_engines
+from utils.schema import upgrade_schema
+from utils.snapshot import warm_snapshot
+from utils.templates import warm_templates
+
+app = create_app()
+
+with app.app_context():
+    upgrade_schema()
+warm_templates(app)
+warm_snapshot(app)
+
+for engine in app_engines(app).values():
+    engine.dispose()